@@ -7,8 +7,15 @@ Built on Microsoft's AutoGen framework for orchestrating specialized development
 __version__ = "0.1.0"
 __author__ = "AutoSquad Team"
 
+import os
+from pathlib import Path
+
 from .cli import main
 from .orchestrator import SquadOrchestrator
 from .project_manager import ProjectManager
 
+# Persist downloaded BPE vocabularies across runs instead of tiktoken's temp-dir default.
+# tiktoken reads this when an encoding is first loaded, not at import time.
+os.environ.setdefault("TIKTOKEN_CACHE_DIR", str(Path.home() / ".cache" / "autosquad" / "tiktoken"))
+
 __all__ = ["main", "SquadOrchestrator", "ProjectManager"] 
\ No newline at end of file
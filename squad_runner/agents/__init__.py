@@ -9,9 +9,12 @@ from .pm import PMAgent
 from .qa import QAAgent
 from .dynamic_agent import DynamicAgent
 
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 from autogen_ext.models.openai import OpenAIChatCompletionClient
 
+if TYPE_CHECKING:
+    from ..project_config_parser import ProjectConfig
+
 
 async def create_agent(
     agent_type: str,
@@ -76,7 +79,7 @@ async def create_agent(
 
 
 def create_project_specific_agents(
-    project_config: Dict[str, Any],
+    project_config: "ProjectConfig",
     model_client: OpenAIChatCompletionClient,
     project_context: Dict[str, Any],
     project_manager
@@ -96,7 +99,7 @@ def create_project_specific_agents(
         Dictionary of created agents keyed by agent name
     """
     agents = {}
-    agent_configs = project_config.get("agents", [])
+    agent_configs = project_config.agents
     
     for agent_config in agent_configs:
         role_config = agent_config.get("role", {})
@@ -1,6 +1,8 @@
 # Enhanced Agent Prompt Templates
 # Based on analysis of prompts from Cursor, v0, Devin, Windsurf, Bolt, and Cline
 
+from ..token_optimization import caveman_compress
+
 ENHANCED_BASE_PROMPT_TEMPLATE = """
 <agent_identity>
 You are {agent_name}, a specialized AI agent in the AutoSquad development framework.
@@ -244,9 +246,11 @@ def get_enhanced_agent_prompt(agent_type: str, project_context: dict) -> str:
         'qa': 'Testing and Quality Validation'
     }
     
-    return ENHANCED_BASE_PROMPT_TEMPLATE.format(
+    # The system prompt is resent every turn, so strip filler from the static template
+    # text; the project prompt and workspace details are interpolated verbatim
+    return caveman_compress(ENHANCED_BASE_PROMPT_TEMPLATE).format(
         agent_name=agent_names.get(agent_type, agent_type.title()),
-        agent_specific_section=agent_specializations.get(agent_type, ''),
+        agent_specific_section=caveman_compress(agent_specializations.get(agent_type, '')),
         agent_role=agent_roles.get(agent_type, agent_type.title()),
         **project_context
     )
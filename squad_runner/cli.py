@@ -89,6 +89,16 @@ def cli():
     default=None,
     help="Maximum number of messages per round (debug mode)"
 )
+@click.option(
+    "--skip-api-check",
+    is_flag=True,
+    help="Skip the live OpenAI API connectivity check"
+)
+@click.option(
+    "--force-api-check",
+    is_flag=True,
+    help="Check OpenAI API connectivity even if the key was validated recently"
+)
 def run(
     project: Path,
     squad_profile: str,
@@ -98,7 +108,9 @@ def run(
     verbose: bool,
     no_live_display: bool,
     debug_mode: bool,
-    max_messages: int
+    max_messages: int,
+    skip_api_check: bool,
+    force_api_check: bool
 ):
     """Run an autonomous development squad on a project (legacy command - use 'run start' instead)."""
     console.print("[yellow]ℹ️  Note: This command is deprecated. Use 'autosquad run start' for new features.[/yellow]\n")
@@ -125,7 +137,9 @@ def run(
             verbose=verbose,
             show_live_progress=not no_live_display,
             debug_mode=debug_mode,
-            max_messages=max_messages
+            max_messages=max_messages,
+            skip_api_check=skip_api_check,
+            force_api_check=force_api_check
         ))
         
         console.print(Panel.fit(
@@ -221,6 +235,16 @@ def run():
     default=None,
     help="Maximum number of messages per round (debug mode)"
 )
+@click.option(
+    "--skip-api-check",
+    is_flag=True,
+    help="Skip the live OpenAI API connectivity check"
+)
+@click.option(
+    "--force-api-check",
+    is_flag=True,
+    help="Check OpenAI API connectivity even if the key was validated recently"
+)
 @click.option(
     "--session-name",
     help="Custom session name for tracking and resuming"
@@ -240,6 +264,8 @@ def start(
     no_live_display: bool,
     debug_mode: bool,
     max_messages: int,
+    skip_api_check: bool,
+    force_api_check: bool,
     session_name: Optional[str],
     save_session: bool
 ):
@@ -308,7 +334,9 @@ def start(
             verbose=verbose,
             show_live_progress=not no_live_display,
             debug_mode=debug_mode,
-            max_messages=max_messages
+            max_messages=max_messages,
+            skip_api_check=skip_api_check,
+            force_api_check=force_api_check
         ))
         
         # Update session status if saved
@@ -919,7 +947,7 @@ def check_api():
     console.print("[dim]🔍 Testing OpenAI API connectivity...[/dim]")
     
     try:
-        api_key = validate_api_key()
+        api_key = validate_api_key(force_check=True)
         console.print(Panel.fit(
             "✅ [bold green]API connection successful![/bold green]\n"
             f"API key: {api_key[:8]}...{api_key[-4:]}\n"
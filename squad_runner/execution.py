@@ -33,7 +33,9 @@ class SquadExecutionEngine:
         verbose: bool = False,
         show_live_progress: bool = True,
         debug_mode: bool = False,
-        max_messages: Optional[int] = None
+        max_messages: Optional[int] = None,
+        skip_api_check: bool = False,
+        force_api_check: bool = False
     ):
         self.project_path = project_path
         self.squad_profile = squad_profile
@@ -44,6 +46,8 @@ class SquadExecutionEngine:
         self.show_live_progress = show_live_progress
         self.debug_mode = debug_mode
         self.max_messages = max_messages or (10 if debug_mode else None)
+        self.skip_api_check = skip_api_check
+        self.force_api_check = force_api_check
         
         # Will be initialized during setup
         self.project_manager = None
@@ -86,7 +90,9 @@ class SquadExecutionEngine:
         validate_all_inputs(
             self.project_path,
             self.squad_profile,
-            self.model
+            self.model,
+            skip_api_check=self.skip_api_check,
+            force_api_check=self.force_api_check
         )
     
     async def _initialize_components(self) -> None:
@@ -109,7 +115,7 @@ class SquadExecutionEngine:
             console.print(f"🔍 [DEBUG] Loaded config and profile: {self.squad_profile}")
         
         # Initialize orchestrator
-        self.orchestrator = SquadOrchestrator(
+        self.orchestrator = SquadOrchestrator.create(
             project_manager=self.project_manager,
             config=config,
             squad_profile=profile,
@@ -293,7 +299,9 @@ async def run_squad(
     verbose: bool = False,
     show_live_progress: bool = True,
     debug_mode: bool = False,
-    max_messages: Optional[int] = None
+    max_messages: Optional[int] = None,
+    skip_api_check: bool = False,
+    force_api_check: bool = False
 ) -> None:
     """
     Run an AutoSquad development session.
@@ -309,7 +317,9 @@ async def run_squad(
         verbose=verbose,
         show_live_progress=show_live_progress,
         debug_mode=debug_mode,
-        max_messages=max_messages
+        max_messages=max_messages,
+        skip_api_check=skip_api_check,
+        force_api_check=force_api_check
     )
     
     await engine.run() 
\ No newline at end of file
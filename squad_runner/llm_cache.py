@@ -0,0 +1,87 @@
+"""
+On-disk response cache for AutoSquad model calls - repeat runs of deterministic
+agent conversations are answered locally instead of re-paying the API.
+
+Enabled with AUTOSQUAD_LLM_CACHE=1. Calls made at a non-zero temperature are only
+cached when AUTOSQUAD_CACHE_NONDETERMINISTIC=1 is also set.
+"""
+
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    from autogen_core import CacheStore
+    from autogen_ext.models.cache import ChatCompletionCache
+except ImportError:  # autogen releases that predate the cache wrapper
+    CacheStore = object
+    ChatCompletionCache = None
+
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "autosquad" / "llm_cache.sqlite"
+DEFAULT_MAX_ROWS = 10000
+
+
+class SQLiteCacheStore(CacheStore):
+    """Cache store keeping pickled model responses in SQLite, evicting least recently used rows."""
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH, max_rows: int = DEFAULT_MAX_ROWS):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_rows = max_rows
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached response for key, or default on a miss."""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return default
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+        return pickle.loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a response, evicting the least recently used rows beyond max_rows."""
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, blob, now, now)
+            )
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_rows,)
+            )
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def wrap_model_client(model_client, temperature: Optional[float] = None):
+    """Wrap a model client in the on-disk response cache when caching is enabled.
+
+    Returns the client unchanged when caching is off, unavailable in the installed
+    autogen, or the calls are non-deterministic and not explicitly opted in.
+    """
+    if os.getenv("AUTOSQUAD_LLM_CACHE") != "1" or ChatCompletionCache is None:
+        return model_client
+
+    deterministic = temperature is not None and temperature <= 0
+    if not deterministic and os.getenv("AUTOSQUAD_CACHE_NONDETERMINISTIC") != "1":
+        return model_client
+
+    return ChatCompletionCache(model_client, SQLiteCacheStore())
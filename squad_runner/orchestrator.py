@@ -3,22 +3,275 @@ Squad Orchestrator - Coordinates AutoGen agents for development workflows
 """
 
 import asyncio
+import collections
+import functools
+import re
 import time
-from typing import Any, Dict, List, Optional
+from types import SimpleNamespace
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
 import openai
-from autogen_agentchat.agents import AssistantAgent
+from autogen_agentchat.base import TaskResult
 from autogen_agentchat.teams import RoundRobinGroupChat
 from autogen_ext.models.openai import OpenAIChatCompletionClient
-from autogen_core import CancellationToken
 
 from .agents import create_agent
 from .config import AutoSquadConfig, SquadProfile
+from .llm_cache import wrap_model_client
 from .project_manager import ProjectManager
-from .token_optimization import TokenOptimizer
+from .token_optimization import TokenOptimizer, caveman_compress
 from .progress_display import LiveProgressDisplay, create_progress_callback
 
 
+class _RoundMessage(NamedTuple):
+    """Compact record of a chat message kept for the lifetime of the session."""
+    
+    sender: str
+    content: str
+    timestamp: Optional[float] = None
+
+
+# Single-pass classifier used to infer agent activity from chat messages
+_MESSAGE_CLASSIFIER_RE = re.compile(
+    r'(?P<file>(?:created|wrote|saved)\s+file\s+[`"]?(?P<filename>[^\s`"]+))'
+    r'|(?P<start>creating|implementing|building|writing)'
+    r'|(?P<done>completed|finished|done|ready)',
+    re.IGNORECASE
+)
+
+
+def _classify_message(content: str) -> Tuple[bool, bool, Optional[str]]:
+    """Scan message content once, returning (started, completed, created_filename)."""
+    started = completed = False
+    filename = None
+    for match in _MESSAGE_CLASSIFIER_RE.finditer(content):
+        kind = match.lastgroup
+        if kind == 'start':
+            started = True
+        elif kind == 'done':
+            completed = True
+        elif filename is None:
+            filename = match.group('filename')
+    return started, completed, filename
+
+
+def _on_action_started(display: LiveProgressDisplay, agent_name: str, args: tuple) -> None:
+    display.agent_started_action(agent_name, args[0])
+
+
+def _on_action_completed(display: LiveProgressDisplay, agent_name: str, args: tuple) -> None:
+    display.agent_completed_action(agent_name, args[0] if args else "")
+
+
+def _on_file_operation(display: LiveProgressDisplay, agent_name: str, args: tuple) -> None:
+    if len(args) >= 2:
+        display.agent_file_operation(agent_name, args[0], args[1])
+
+
+# Agent progress event type -> display handler
+_EVENT_DISPATCH = {
+    "agent_action_started": _on_action_started,
+    "agent_action_completed": _on_action_completed,
+    "file_operation": _on_file_operation,
+}
+
+
+_ROUND_PROMPT_TEMPLATE = """
+🚀 AutoSquad Development Round {round_num}
+
+PROJECT OBJECTIVE:
+{project_prompt}
+
+CURRENT WORKSPACE STATE:
+{workspace_summary}
+
+ROUND {round_num} MANDATORY REQUIREMENTS:
+
+🏗️ **NEXT.JS 15 APP ROUTER STRUCTURE (REQUIRED):**
+- Use App Router NOT Pages Router
+- Create `app/` directory (NOT `src/pages/`)
+- Main page: `app/page.tsx` (NOT `pages/index.tsx`)
+- Layout: `app/layout.tsx` (NOT `pages/_app.tsx`)
+- API routes: `app/api/[route]/route.ts`
+
+📋 **ESSENTIAL PROJECT FILES (CREATE FIRST):**
+1. **package.json** - Dependencies: next@15, react@18, typescript, tailwindcss, @types/node, @types/react
+2. **next.config.js** - Next.js configuration
+3. **tsconfig.json** - TypeScript configuration  
+4. **tailwind.config.js** - Tailwind CSS configuration
+5. **postcss.config.js** - PostCSS for Tailwind
+
+🎯 **AGENT SPECIFIC TASKS:**
+1. **PM**: Create project structure and essential config files
+2. **Engineer**: Build App Router pages and API routes with working TypeScript
+3. **Architect**: Design proper folder structure following Next.js 15 best practices  
+4. **QA**: Verify all files can actually run (`npm run dev` should work)
+
+⚠️ **CRITICAL REQUIREMENTS:**
+- NEVER use `src/pages/` structure - this is DEPRECATED
+- ALWAYS use `app/` directory for App Router
+- Include ALL dependencies in package.json
+- Create working, runnable Next.js 15 project
+- Use server components where possible
+- Implement proper TypeScript types
+
+📁 **CORRECT STRUCTURE EXAMPLE:**
+```
+package.json
+next.config.js
+tsconfig.json
+tailwind.config.js
+app/
+  ├── layout.tsx     (root layout)
+  ├── page.tsx       (homepage)
+  ├── globals.css    (global styles)
+  ├── components/    (reusable components)
+  └── api/           (API routes)
+```
+
+START WORKING NOW - CREATE PRODUCTION-READY NEXT.JS 15 APP ROUTER PROJECT!
+"""
+
+_QUOTA_ERROR_MSG = "OpenAI API quota exceeded - Please add credits to your account"
+_RATE_LIMIT_ERROR_MSG = "OpenAI API rate limit exceeded - Failed after {attempts} attempts"
+
+_RATE_LIMIT_ERROR_TEMPLATE = """
+🚫 {error_msg}
+
+💡 To resolve this issue:
+   • Check your OpenAI billing: https://platform.openai.com/settings/organization/billing
+   • Add credits to your account if quota is exceeded
+   • Wait a few minutes if hitting rate limits
+   • Consider upgrading your plan for higher limits
+
+Original error: {error}
+"""
+
+_API_ERROR_TEMPLATE = """
+🚫 OpenAI API Error
+
+💡 This might be a temporary issue. Please try:
+   • Waiting a few minutes and retrying
+   • Checking OpenAI status: https://status.openai.com/
+   • Verifying your API key is valid
+
+Original error: {error}
+"""
+
+
+# Matches OpenAI mentions in wrapped error text without lowercasing a copy of it
+_OPENAI_MENTION_RE = re.compile(r'openai', re.IGNORECASE)
+
+
+def _is_quota_error(exc: Exception, error_str: str) -> bool:
+    """Check whether a rate limit error is actually an exhausted quota (not retryable)."""
+    if "insufficient_quota" in error_str:
+        return True
+    response = getattr(exc, 'response', None)
+    if response:
+        try:
+            error_data = response.json() if hasattr(response, 'json') else {}
+            if 'error' in error_data:
+                return error_data['error'].get('type', 'rate_limit') == 'insufficient_quota'
+        except Exception:
+            pass
+    return False
+
+
+def _classify_and_format_api_error(exc: Exception, attempt: int, max_retries: int) -> Tuple[str, bool, Optional[str]]:
+    """Classify a failed round attempt.
+    
+    Returns (label, is_fatal, friendly_error). A friendly_error means the caller
+    should raise it in place of the original; is_fatal without one means the
+    original exception should be re-raised; otherwise the attempt is retryable.
+    """
+    error_str = str(exc)
+    is_last_attempt = attempt >= max_retries
+    
+    # AutoGen wraps OpenAI errors in RuntimeError, so also match on the message
+    if isinstance(exc, openai.RateLimitError) or (isinstance(exc, RuntimeError) and "RateLimitError" in error_str):
+        is_quota_error = _is_quota_error(exc, error_str)
+        if not (is_quota_error or is_last_attempt):
+            return "OpenAI rate limit error", False, None
+        error_msg = _QUOTA_ERROR_MSG if is_quota_error else _RATE_LIMIT_ERROR_MSG.format(attempts=max_retries + 1)
+        return "OpenAI rate limit error", True, _RATE_LIMIT_ERROR_TEMPLATE.format(error_msg=error_msg, error=error_str)
+    
+    if isinstance(exc, RuntimeError):
+        if "APIError" in error_str or _OPENAI_MENTION_RE.search(error_str):
+            if not is_last_attempt:
+                return "OpenAI API error", False, None
+            return "OpenAI API error", True, _API_ERROR_TEMPLATE.format(error=error_str)
+        # Re-raise non-OpenAI runtime errors immediately
+        return "Runtime error", True, None
+    
+    # Retry other unexpected errors until the last attempt
+    return "Unexpected error", is_last_attempt, None
+
+
+class _RateLimiter:
+    """Token-bucket throttle for OpenAI requests-per-minute and tokens-per-minute limits."""
+    
+    def __init__(self, rpm: Optional[int] = None, tpm: Optional[int] = None):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._request_allowance = float(rpm or 0)
+        self._token_allowance = float(tpm or 0)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    def _refill(self) -> None:
+        """Top up both buckets for the time elapsed since the last refill."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        if self.rpm:
+            self._request_allowance = min(self.rpm, self._request_allowance + elapsed * self.rpm / 60)
+        if self.tpm:
+            self._token_allowance = min(self.tpm, self._token_allowance + elapsed * self.tpm / 60)
+    
+    async def acquire(self, tokens: int) -> None:
+        """Wait until a request of roughly ``tokens`` tokens fits within the limits."""
+        # Requests larger than a full bucket only wait for the bucket to fill up
+        tokens = min(tokens, self.tpm) if self.tpm else 0
+        
+        async with self._lock:
+            while True:
+                self._refill()
+                wait = 0.0
+                if self.rpm and self._request_allowance < 1:
+                    wait = (1 - self._request_allowance) * 60 / self.rpm
+                if self.tpm and self._token_allowance < tokens:
+                    wait = max(wait, (tokens - self._token_allowance) * 60 / self.tpm)
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+            
+            if self.rpm:
+                self._request_allowance -= 1
+            self._token_allowance -= tokens
+
+
+class _RateLimitedChatClient(OpenAIChatCompletionClient):
+    """OpenAI client that waits for rate limit headroom before every model request."""
+    
+    def __init__(self, *args, rate_limiter: _RateLimiter, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._rate_limiter = rate_limiter
+    
+    async def _throttle(self, messages, kwargs: Dict[str, Any]) -> None:
+        """Charge one request and the prompt tokens actually being sent."""
+        await self._rate_limiter.acquire(self.count_tokens(messages, tools=kwargs.get("tools", [])))
+    
+    async def create(self, messages, **kwargs):
+        await self._throttle(messages, kwargs)
+        return await super().create(messages, **kwargs)
+    
+    async def create_stream(self, messages, **kwargs):
+        await self._throttle(messages, kwargs)
+        async for chunk in super().create_stream(messages, **kwargs):
+            yield chunk
+
+
 class SquadOrchestrator:
     """Main orchestrator for managing AutoGen agent squads."""
     
@@ -45,37 +298,110 @@ class SquadOrchestrator:
         # Initialize agents
         self.agents = []
         self.group_chat = None
-        self.conversation_history = []
+        # Bounded history: O(1) appends with automatic eviction of the oldest messages.
+        # llm_config.history_window (default 400) caps how many messages the round
+        # summary and context optimization see; earlier rounds drop out once it fills.
+        self.conversation_history = collections.deque(
+            maxlen=config.llm_config.get("history_window", 400)
+        )
+        self._total_messages = 0  # every message exchanged, unaffected by history eviction
+        self._pending_reflection: Optional[asyncio.Task] = None
+        self._last_opt_result: Optional[Dict[str, Any]] = None
+        self._workspace_views: Optional[Tuple[int, Dict[str, Any], str]] = None
         
-        # Initialize model client
-        self.model_client = self._create_model_client()
+        # Round state is persisted by a background writer fed through this queue
+        self._save_queue: asyncio.Queue = asyncio.Queue()
+        self._save_task: Optional[asyncio.Task] = None
+        self._save_error: Optional[Exception] = None  # First failed save, re-raised by the caller
         
-        # Initialize token optimization
-        self.token_optimizer = TokenOptimizer(
-            model=model,
-            max_context_tokens=config.llm_config.get("max_tokens", 6000)
-        )
+        # Proactively throttle requests when rate limits are configured
+        rpm = config.llm_config.get("rpm")
+        tpm = config.llm_config.get("tpm")
+        self._rate_limiter = _RateLimiter(rpm, tpm) if (rpm or tpm) else None
+        
+        # Signalled by the token optimizer so the chat monitor only wakes on changes
+        self._token_event = asyncio.Event()
+        
+        # model_client, token_optimizer and progress_display are created on first access
         
-        # Initialize progress display
-        if show_live_progress:
-            self.progress_display = LiveProgressDisplay()
-            self.progress_callbacks = create_progress_callback(self.progress_display)
-        else:
-            self.progress_display = None
-            self.progress_callbacks = {}
-            
         if self.debug_mode and self.verbose:
             print(f"[DEBUG] SquadOrchestrator initialized with max_messages: {self.max_messages}")
     
+    @classmethod
+    def create(cls, *args, debug_mode: bool = False, **kwargs) -> "SquadOrchestrator":
+        """Construct an orchestrator, using the debug specialization when debug_mode is set.
+        
+        Picking the class up front keeps debug-only simulation out of the hot path.
+        """
+        orchestrator_cls = _DebugOrchestrator if debug_mode else cls
+        return orchestrator_cls(*args, debug_mode=debug_mode, **kwargs)
+    
+    @functools.cached_property
+    def model_client(self) -> OpenAIChatCompletionClient:
+        """Model client shared by all agents."""
+        return self._create_model_client()
+    
+    @functools.cached_property
+    def token_optimizer(self) -> TokenOptimizer:
+        """Token optimizer, wired to wake the chat monitor on usage changes."""
+        token_optimizer = TokenOptimizer(
+            model=self.model,
+            max_context_tokens=self.config.llm_config.get("max_tokens", 6000),
+            history_window=self.conversation_history.maxlen
+        )
+        token_optimizer.add_usage_listener(self._token_event.set)
+        return token_optimizer
+    
+    @functools.cached_property
+    def progress_display(self) -> Optional[LiveProgressDisplay]:
+        """Live progress display, or None when live progress is disabled."""
+        return LiveProgressDisplay(debug_mode=self.debug_mode) if self.show_live_progress else None
+    
+    @functools.cached_property
+    def progress_callbacks(self) -> Optional[SimpleNamespace]:
+        """Progress callbacks bound to the live display, or None without one."""
+        if self.progress_display is None:
+            return None
+        return create_progress_callback(self.progress_display)
+    
+    def _simulate_initial_tokens(self) -> None:
+        """Hook for simulated prompt usage at round start (no-op outside debug mode)."""
+    
+    def _simulate_round_tokens(self, messages: List[_RoundMessage], round_tokens: int) -> int:
+        """Hook for adjusting a round's counted tokens (identity outside debug mode)."""
+        return round_tokens
+    
+    def _monitor_usage(self, update_count: int) -> Tuple[int, float]:
+        """Hook returning the (tokens, cost) shown on each monitor wake-up (real usage outside debug mode)."""
+        usage_summary = self.token_optimizer.get_usage_summary()
+        return usage_summary["total_tokens_used"], usage_summary["estimated_cost_usd"]
+    
     def _create_model_client(self):
         """Create the model client for agents."""
         llm_config = self.config.llm_config
         
-        return OpenAIChatCompletionClient(
+        # Throttle each model request (one per agent turn) when rate limits are configured
+        client_kwargs = {"rate_limiter": self._rate_limiter} if self._rate_limiter else {}
+        client_cls = _RateLimitedChatClient if self._rate_limiter else OpenAIChatCompletionClient
+        model_client = client_cls(
             model=self.model,
             api_key=llm_config.get("api_key"),
             # Note: v0.4 API may have different parameter names
+            **client_kwargs
         )
+        # Serve repeated deterministic calls from disk when AUTOSQUAD_LLM_CACHE=1
+        return wrap_model_client(model_client, llm_config.get("temperature"))
+    
+    def _get_workspace_views(self) -> Tuple[Dict[str, Any], str]:
+        """Get (project_context, workspace_summary), cached until the workspace changes."""
+        generation = self.project_manager.workspace.generation
+        if self._workspace_views is None or self._workspace_views[0] != generation:
+            self._workspace_views = (
+                generation,
+                self.project_manager.get_project_context(),
+                self.project_manager.get_workspace_summary()
+            )
+        return self._workspace_views[1], self._workspace_views[2]
     
     async def _create_agents(self):
         """Create agents based on the squad profile."""
@@ -101,21 +427,7 @@ class SquadOrchestrator:
             
             # Set up progress callbacks for the agent
             if self.progress_display and hasattr(agent, 'set_progress_callback'):
-                def create_callback(agent_name):
-                    def callback(event_type, *args):
-                        if self.debug_mode and self.verbose:
-                            print(f"[DEBUG] Progress callback: {agent_name} -> {event_type}: {args}")
-                        
-                        if event_type == "agent_action_started":
-                            self.progress_display.agent_started_action(agent_name, args[0])
-                        elif event_type == "agent_action_completed":
-                            self.progress_display.agent_completed_action(agent_name, args[0] if args else "")
-                        elif event_type == "file_operation":
-                            if len(args) >= 2:
-                                self.progress_display.agent_file_operation(agent_name, args[0], args[1])
-                    return callback
-                
-                agent.set_progress_callback(create_callback(agent.name))
+                agent.set_progress_callback(functools.partial(self._dispatch_progress, agent.name))
                 
                 if self.debug_mode and self.verbose:
                     print(f"[DEBUG] Progress callback set for {agent.name}")
@@ -132,6 +444,12 @@ class SquadOrchestrator:
             if self.verbose:
                 print(f"Created {agent_type} agent: {agent.name}")
     
+    def _dispatch_progress(self, agent_name: str, event_type: str, *args) -> None:
+        """Route an agent progress event to the live display."""
+        handler = _EVENT_DISPATCH.get(event_type)
+        if handler is not None:
+            handler(self.progress_display, agent_name, args)
+    
     async def _create_group_chat(self):
         """Create the AutoGen group chat."""
         if not self.agents:
@@ -146,7 +464,7 @@ class SquadOrchestrator:
             print(f"Created group chat with {len(self.agents)} agents")
     
     async def _run_monitored_group_chat(self, round_prompt: str, round_num: int):
-        """Run group chat with progress monitoring."""
+        """Run group chat with progress monitoring, yielding messages as they arrive."""
         if self.progress_display:
             self.progress_display.agent_started_action("System", f"Starting agent collaboration")
         
@@ -156,12 +474,12 @@ class SquadOrchestrator:
             monitor_task = asyncio.create_task(self._monitor_chat_progress(round_num))
         
         try:
-            # Run the actual group chat
-            result = await self.group_chat.run(
-                task=round_prompt
-                # Note: v0.4 API parameters may be different
-            )
-            return result
+            # Stream the group chat so callers can process each message immediately
+            async for item in self.group_chat.run_stream(task=round_prompt):
+                # The final TaskResult only repeats the messages already streamed
+                if isinstance(item, TaskResult):
+                    continue
+                yield item
         finally:
             # Stop monitoring
             if monitor_task:
@@ -172,59 +490,61 @@ class SquadOrchestrator:
                     pass
     
     async def _monitor_chat_progress(self, round_num: int):
-        """Periodically update progress during chat execution."""
+        """Push token usage updates to the display as they happen during chat execution."""
+        heartbeat = 30  # seconds between elapsed-time status refreshes while idle
+        started_at = time.monotonic()
         update_count = 0
         while True:
-            await asyncio.sleep(10)  # Update every 10 seconds
+            try:
+                await asyncio.wait_for(self._token_event.wait(), timeout=heartbeat)
+            except asyncio.TimeoutError:
+                pass
+            self._token_event.clear()
             update_count += 1
+            elapsed = int(time.monotonic() - started_at)
             
             if self.progress_display:
-                # In debug mode, simulate progressive token usage
-                if self.debug_mode:
-                    # Simulate gradual token accumulation
-                    simulated_tokens = update_count * 200  # 200 tokens per 10-second interval
-                    simulated_cost = simulated_tokens * 0.00015 / 1000  # GPT-4o-mini input rate
-                    
-                    self.progress_display.update_token_usage(
-                        self.token_optimizer.total_tokens_used + simulated_tokens,
-                        simulated_cost
-                    )
-                    
-                    if self.verbose:
-                        print(f"[DEBUG] Simulated token progress: +{simulated_tokens} tokens, ${simulated_cost:.6f}")
-                else:
-                    # Update with actual usage
-                    usage_summary = self.token_optimizer.get_usage_summary()
-                    self.progress_display.update_token_usage(
-                        usage_summary["total_tokens_used"],
-                        usage_summary["estimated_cost_usd"]
-                    )
+                self.progress_display.update_token_usage(*self._monitor_usage(update_count))
                 
                 # Update status
                 self.progress_display.agent_started_action(
                     "System", 
-                    f"Round {round_num} in progress... ({update_count * 10}s elapsed)"
+                    f"Round {round_num} in progress... ({elapsed}s elapsed)"
                 )
     
     async def run_round(self, round_num: int, reflect: bool = True):
         """Run a single development round."""
-        if not self.group_chat:
-            await self._create_group_chat()
-        
-        # Update progress display
-        if self.progress_display:
-            self.progress_display.update_round_info(round_num, self.squad_profile.rounds or 5)
-        
-        # Get project context for the round
-        project_context = self.project_manager.get_project_context()
-        workspace_summary = self.project_manager.get_workspace_summary()
+        # Make sure the previous round's state is persisted before agents touch the workspace again
+        await self._save_queue.join()
+        self._raise_save_error()
         
-        # Create the round prompt
+        # Get project context and build the round prompt while the previous
+        # round's background reflection is still running
+        project_context, workspace_summary = self._get_workspace_views()
         round_prompt = self._create_round_prompt(
             round_num=round_num,
             project_context=project_context,
             workspace_summary=workspace_summary
         )
+        prompt_views = self._workspace_views
+        
+        # Let the reflection finish before reusing the chat; only rebuild the
+        # prompt if its agents changed the workspace meanwhile
+        await self._await_pending_reflection()
+        project_context, workspace_summary = self._get_workspace_views()
+        if self._workspace_views is not prompt_views:
+            round_prompt = self._create_round_prompt(
+                round_num=round_num,
+                project_context=project_context,
+                workspace_summary=workspace_summary
+            )
+        
+        if not self.group_chat:
+            await self._create_group_chat()
+        
+        # Update progress display
+        if self.progress_display:
+            self.progress_display.update_round_info(round_num, self.squad_profile.rounds or 5)
         
         if self.verbose:
             print(f"Starting round {round_num} with prompt: {round_prompt[:100]}...")
@@ -232,24 +552,8 @@ class SquadOrchestrator:
         # Start progress tracking for this round
         if self.progress_display:
             self.progress_display.agent_started_action("System", f"Starting Round {round_num}")
+            self._simulate_initial_tokens()
             
-            # In debug mode, simulate some initial token usage
-            if self.debug_mode:
-                initial_tokens = 300  # Simulate initial prompt tokens
-                initial_cost = initial_tokens * 0.00015 / 1000  # GPT-4o-mini rate
-                self.token_optimizer.track_api_call(
-                    input_tokens=initial_tokens,
-                    output_tokens=0,
-                    cost_estimate=initial_cost
-                )
-                usage_summary = self.token_optimizer.get_usage_summary()
-                self.progress_display.update_token_usage(
-                    usage_summary["total_tokens_used"],
-                    usage_summary["estimated_cost_usd"]
-                )
-                if self.verbose:
-                    print(f"[DEBUG] Initial token simulation: {initial_tokens} tokens, ${initial_cost:.6f}")
-                    
         elif self.verbose:
             print(f"Starting round {round_num} with {len(self.agents)} agents...")
             print(f"Project context: {len(project_context.get('current_files', []))} files in workspace")
@@ -257,9 +561,11 @@ class SquadOrchestrator:
         # Optimize conversation context before sending
         if self.conversation_history:
             optimized_history, optimization_stats = self.token_optimizer.optimize_conversation_context(
-                self.conversation_history,
-                system_message=round_prompt
+                list(self.conversation_history),
+                system_message=round_prompt,
+                prev_result=self._last_opt_result
             )
+            self._last_opt_result = optimization_stats
             
             if self.verbose and optimization_stats["removed_messages"] > 0:
                 print(f"Token optimization: Removed {optimization_stats['removed_messages']} messages, "
@@ -285,15 +591,16 @@ class SquadOrchestrator:
                     await asyncio.sleep(retry_delay)
                     retry_delay *= 2  # Exponential backoff
                 
-                # Use AutoGen's group chat to run the conversation (v0.4 API)
-                result = await self._run_monitored_group_chat(round_prompt, round_num)
-                
-                # Process the conversation result
-                await self._process_round_result(round_num, result)
+                # Use AutoGen's group chat to run the conversation (v0.4 API),
+                # processing each message as it is streamed back
+                await self._process_round_result(
+                    round_num,
+                    self._run_monitored_group_chat(round_prompt, round_num)
+                )
                 
-                # Reflection phase
+                # Reflection phase runs in the background, overlapping the next round's setup
                 if reflect and round_num % self.squad_profile.reflection_frequency == 0:
-                    await self._run_reflection(round_num)
+                    self._pending_reflection = asyncio.create_task(self._run_reflection(round_num))
                 
                 # Update progress display
                 if self.progress_display:
@@ -304,175 +611,28 @@ class SquadOrchestrator:
                     print(f"✅ Round {round_num} succeeded on attempt {attempt + 1}")
                 break
             
-            except openai.RateLimitError as e:
-                if self.verbose:
-                    print(f"⚠️ OpenAI rate limit error in round {round_num} (attempt {attempt + 1}): {e}")
-                
-                # Check if this is the last attempt or if it's a quota error (not retryable)
-                is_quota_error = False
-                if hasattr(e, 'response') and e.response:
-                    try:
-                        error_data = e.response.json() if hasattr(e.response, 'json') else {}
-                        if 'error' in error_data:
-                            error_type = error_data['error'].get('type', 'rate_limit')
-                            is_quota_error = error_type == 'insufficient_quota'
-                    except:
-                        pass
-                
-                # Don't retry quota errors or if this is the last attempt
-                if is_quota_error or attempt >= max_retries:
-                    # Create a more helpful error message
-                    if is_quota_error:
-                        error_msg = "OpenAI API quota exceeded - Please add credits to your account"
-                    else:
-                        error_msg = f"OpenAI API rate limit exceeded - Failed after {max_retries + 1} attempts"
-                    
-                    friendly_error = f"""
-🚫 {error_msg}
-
-💡 To resolve this issue:
-   • Check your OpenAI billing: https://platform.openai.com/settings/organization/billing
-   • Add credits to your account if quota is exceeded
-   • Wait a few minutes if hitting rate limits
-   • Consider upgrading your plan for higher limits
-
-Original error: {str(e)}
-"""
-                    
-                    raise RuntimeError(friendly_error) from e
-                
-                # Continue to next retry attempt for retryable rate limits
-                continue
-            
-            except RuntimeError as e:
-                # Check if this is a wrapped OpenAI error from AutoGen
-                error_str = str(e)
-                if "RateLimitError" in error_str:
-                    if self.verbose:
-                        print(f"⚠️ OpenAI rate limit error in round {round_num} (attempt {attempt + 1}): {error_str}")
-                    
-                    # Check if this is a quota error (not retryable)
-                    is_quota_error = "insufficient_quota" in error_str
-                    
-                    # Don't retry quota errors or if this is the last attempt
-                    if is_quota_error or attempt >= max_retries:
-                        # Create a more helpful error message
-                        if is_quota_error:
-                            error_msg = "OpenAI API quota exceeded - Please add credits to your account"
-                        else:
-                            error_msg = f"OpenAI API rate limit exceeded - Failed after {max_retries + 1} attempts"
-                        
-                        friendly_error = f"""
-🚫 {error_msg}
-
-💡 To resolve this issue:
-   • Check your OpenAI billing: https://platform.openai.com/settings/organization/billing
-   • Add credits to your account if quota is exceeded
-   • Wait a few minutes if hitting rate limits
-   • Consider upgrading your plan for higher limits
-
-Original error: {error_str}
-"""
-                        
-                        raise RuntimeError(friendly_error) from e
-                    
-                    # Continue to next retry attempt for retryable rate limits
-                    continue
-                
-                elif "APIError" in error_str or "openai" in error_str.lower():
-                    if self.verbose:
-                        print(f"⚠️ OpenAI API error in round {round_num} (attempt {attempt + 1}): {error_str}")
-                    
-                    # Don't retry API errors on the last attempt
-                    if attempt >= max_retries:
-                        friendly_error = f"""
-🚫 OpenAI API Error
-
-💡 This might be a temporary issue. Please try:
-   • Waiting a few minutes and retrying
-   • Checking OpenAI status: https://status.openai.com/
-   • Verifying your API key is valid
-
-Original error: {error_str}
-"""
-                        
-                        raise RuntimeError(friendly_error) from e
-                    
-                    # Continue to next retry attempt
-                    continue
-                
-                # Re-raise non-OpenAI errors immediately
-                raise
-            
             except Exception as e:
-                # Handle other unexpected errors
+                label, is_fatal, friendly_error = _classify_and_format_api_error(e, attempt, max_retries)
                 if self.verbose:
-                    print(f"⚠️ Unexpected error in round {round_num} (attempt {attempt + 1}): {e}")
+                    print(f"⚠️ {label} in round {round_num} (attempt {attempt + 1}): {e}")
                 
-                # Don't retry unexpected errors on the last attempt
-                if attempt >= max_retries:
+                if friendly_error:
+                    raise RuntimeError(friendly_error) from e
+                if is_fatal:
                     raise
                 
-                # Continue to next retry attempt for other errors
+                # Continue to next retry attempt for retryable errors
                 continue
     
     def _create_round_prompt(self, round_num: int, project_context: Dict[str, Any], workspace_summary: str) -> str:
         """Create the prompt for a development round."""
-        base_prompt = f"""
-🚀 AutoSquad Development Round {round_num}
-
-PROJECT OBJECTIVE:
-{project_context.get('prompt', 'No prompt specified')}
-
-CURRENT WORKSPACE STATE:
-{workspace_summary}
-
-ROUND {round_num} MANDATORY REQUIREMENTS:
-
-🏗️ **NEXT.JS 15 APP ROUTER STRUCTURE (REQUIRED):**
-- Use App Router NOT Pages Router
-- Create `app/` directory (NOT `src/pages/`)
-- Main page: `app/page.tsx` (NOT `pages/index.tsx`)
-- Layout: `app/layout.tsx` (NOT `pages/_app.tsx`)
-- API routes: `app/api/[route]/route.ts`
-
-📋 **ESSENTIAL PROJECT FILES (CREATE FIRST):**
-1. **package.json** - Dependencies: next@15, react@18, typescript, tailwindcss, @types/node, @types/react
-2. **next.config.js** - Next.js configuration
-3. **tsconfig.json** - TypeScript configuration  
-4. **tailwind.config.js** - Tailwind CSS configuration
-5. **postcss.config.js** - PostCSS for Tailwind
-
-🎯 **AGENT SPECIFIC TASKS:**
-1. **PM**: Create project structure and essential config files
-2. **Engineer**: Build App Router pages and API routes with working TypeScript
-3. **Architect**: Design proper folder structure following Next.js 15 best practices  
-4. **QA**: Verify all files can actually run (`npm run dev` should work)
-
-⚠️ **CRITICAL REQUIREMENTS:**
-- NEVER use `src/pages/` structure - this is DEPRECATED
-- ALWAYS use `app/` directory for App Router
-- Include ALL dependencies in package.json
-- Create working, runnable Next.js 15 project
-- Use server components where possible
-- Implement proper TypeScript types
-
-📁 **CORRECT STRUCTURE EXAMPLE:**
-```
-package.json
-next.config.js
-tsconfig.json
-tailwind.config.js
-app/
-  ├── layout.tsx     (root layout)
-  ├── page.tsx       (homepage)
-  ├── globals.css    (global styles)
-  ├── components/    (reusable components)
-  └── api/           (API routes)
-```
-
-START WORKING NOW - CREATE PRODUCTION-READY NEXT.JS 15 APP ROUTER PROJECT!
-"""
+        # Only the static template is stripped of filler; the user's prompt and
+        # workspace content are interpolated verbatim
+        base_prompt = caveman_compress(_ROUND_PROMPT_TEMPLATE).format_map({
+            "round_num": round_num,
+            "project_prompt": project_context.get('prompt', 'No prompt specified'),
+            "workspace_summary": workspace_summary
+        })
         
         # Add conversation summary if we have history
         if self.conversation_history:
@@ -482,57 +642,61 @@ START WORKING NOW - CREATE PRODUCTION-READY NEXT.JS 15 APP ROUTER PROJECT!
         
         return base_prompt
     
-    async def _process_round_result(self, round_num: int, result):
-        """Process the result of a development round."""
-        # Extract messages from the result
+    async def _process_round_result(self, round_num: int, stream):
+        """Process the messages of a development round as they are streamed."""
         messages = []
-        
-        if hasattr(result, 'messages'):
-            for message in result.messages:
-                msg_data = {
-                    "sender": message.source,
-                    "content": message.content,
-                    "timestamp": getattr(message, 'timestamp', None)
-                }
-                messages.append(msg_data)
-                
-                # Update progress display with each message
-                if self.progress_display:
-                    self.progress_display.agent_sent_message(message.source, message.content)
-                    
-                    # Check if this message indicates an action started/completed
-                    content_lower = message.content.lower()
-                    if any(keyword in content_lower for keyword in ['creating', 'implementing', 'building', 'writing']):
-                        self.progress_display.agent_started_action(message.source, "Working on implementation")
-                    elif any(keyword in content_lower for keyword in ['completed', 'finished', 'done', 'ready']):
-                        self.progress_display.agent_completed_action(message.source, "Task completed")
-                    
-                    # Check for file operations mentioned in messages
-                    if any(keyword in content_lower for keyword in ['created file', 'wrote file', 'saved file']):
-                        # Try to extract filename from message
-                        import re
-                        file_match = re.search(r'(?:created|wrote|saved)\s+(?:file\s+)?[`"]?([^\s`"]+)[`"]?', content_lower)
-                        if file_match:
-                            filename = file_match.group(1)
-                            self.progress_display.agent_file_operation(message.source, "create", filename)
-        
-        # Track token usage for this round
-        round_tokens = sum(self.token_optimizer.count_message_tokens(msg) for msg in messages)
-        
-        # In debug mode, simulate more realistic token usage
-        if self.debug_mode:
-            # Simulate realistic token usage for the conversation
-            estimated_tokens = len(messages) * 150  # Rough estimate per message
-            round_tokens = max(round_tokens, estimated_tokens)
+        round_tokens = 0
+        counted = 0  # messages already included in round_tokens
+        token_batch_size = 16
+        prompt_tokens = completion_tokens = 0  # usage reported by the model client
+        usage_reported = False
+        
+        async for message in stream:
+            messages.append(_RoundMessage(message.source, message.content, getattr(message, 'timestamp', None)))
             
-            if self.verbose:
-                print(f"[DEBUG] Simulated token usage: {round_tokens} tokens for {len(messages)} messages")
+            # Record reported usage as each model call lands so the live monitor wakes on it
+            usage = getattr(message, 'models_usage', None)
+            if usage is not None:
+                self.token_optimizer.track_api_call(
+                    input_tokens=usage.prompt_tokens,
+                    output_tokens=usage.completion_tokens,
+                    cost_estimate=None
+                )
+                prompt_tokens += usage.prompt_tokens
+                completion_tokens += usage.completion_tokens
+                usage_reported = True
+            
+            # Estimate token usage in batches to amortize encoder calls, unless the client reports it
+            if not usage_reported and len(messages) - counted >= token_batch_size:
+                round_tokens += self.token_optimizer.count_messages_tokens(messages[counted:])
+                counted = len(messages)
+            
+            # Update progress display with each message
+            if self.progress_display:
+                self.progress_display.agent_sent_message(message.source, message.content)
+                
+                # Check if this message indicates an action started/completed
+                started, completed, filename = _classify_message(message.content)
+                if started:
+                    self.progress_display.agent_started_action(message.source, "Working on implementation")
+                elif completed:
+                    self.progress_display.agent_completed_action(message.source, "Task completed")
+                
+                # Report file operations mentioned in messages
+                if filename:
+                    self.progress_display.agent_file_operation(message.source, "create", filename)
         
-        token_call_data = self.token_optimizer.track_api_call(
-            input_tokens=int(round_tokens * 0.7),  # 70% input
-            output_tokens=int(round_tokens * 0.3),  # 30% output
-            cost_estimate=None
-        )
+        if usage_reported:
+            round_tokens = prompt_tokens + completion_tokens
+        else:
+            # No RequestUsage from the client: fall back to estimating the split
+            round_tokens += self.token_optimizer.count_messages_tokens(messages[counted:])
+            round_tokens = self._simulate_round_tokens(messages, round_tokens)
+            self.token_optimizer.track_api_call(
+                input_tokens=int(round_tokens * 0.7),  # 70% input
+                output_tokens=int(round_tokens * 0.3),  # 30% output
+                cost_estimate=None
+            )
         
         # Update progress display with token usage
         if self.progress_display:
@@ -545,17 +709,57 @@ START WORKING NOW - CREATE PRODUCTION-READY NEXT.JS 15 APP ROUTER PROJECT!
             if self.debug_mode and self.verbose:
                 print(f"[DEBUG] Updated progress display - Tokens: {usage_summary['total_tokens_used']}, Cost: ${usage_summary['estimated_cost_usd']:.6f}")
         
-        # Save the conversation and workspace state
-        await self.project_manager.save_round_state(round_num, messages)
+        # Hand the conversation and workspace state to the background writer
+        self._enqueue_round_save(round_num, messages)
         
-        # Store for our own tracking
-        self.conversation_history.extend(messages)
+        # Store for our own tracking, collapsing verbatim repeats to save context tokens
+        self._total_messages += len(messages)
+        kept = self.token_optimizer.collapse_repeated_messages(messages)
+        window = self.conversation_history.maxlen
+        evicted = len(self.conversation_history) + len(kept) - window if window is not None else 0
+        if evicted > 0 and self.verbose:
+            print(f"Conversation history window full: dropping {evicted} oldest messages "
+                  f"(history_window={window})")
+        self.conversation_history.extend(kept)
         
         if self.verbose:
             print(f"Round {round_num} completed. {len(messages)} messages exchanged. "
-                  f"Token usage: {token_call_data['total_tokens']} tokens, "
+                  f"Token usage: {round_tokens} tokens, "
                   f"Estimated cost: ${usage_summary['estimated_cost_usd']:.6f}")
     
+    def _enqueue_round_save(self, round_num: int, messages: List[_RoundMessage]):
+        """Queue a round's state for persistence without blocking the round."""
+        if self._save_task is None:
+            self._save_task = asyncio.create_task(self._save_writer())
+        self._save_queue.put_nowait((round_num, messages))
+    
+    async def _save_writer(self):
+        """Persist queued round state in the background."""
+        while True:
+            round_num, messages = await self._save_queue.get()
+            try:
+                await self.project_manager.save_round_state(round_num, [msg._asdict() for msg in messages])
+            except Exception as e:
+                print(f"❌ Error saving state for round {round_num}: {e}")
+                if self._save_error is None:
+                    self._save_error = e
+            finally:
+                self._save_queue.task_done()
+    
+    def _raise_save_error(self):
+        """Surface a background save failure on the calling path."""
+        if self._save_error is not None:
+            error, self._save_error = self._save_error, None
+            raise RuntimeError(f"Failed to save round state: {error}") from error
+    
+    async def _await_pending_reflection(self):
+        """Wait for an outstanding background reflection, if any."""
+        if self._pending_reflection:
+            try:
+                await self._pending_reflection
+            finally:
+                self._pending_reflection = None
+    
     async def _run_reflection(self, round_num: int):
         """Run a reflection phase to assess progress."""
         if self.verbose:
@@ -564,8 +768,8 @@ START WORKING NOW - CREATE PRODUCTION-READY NEXT.JS 15 APP ROUTER PROJECT!
         if self.progress_display:
             self.progress_display.agent_started_action("System", f"Reflection phase")
         
-        # Create reflection prompt
-        workspace_summary = self.project_manager.get_workspace_summary()
+        # Create reflection prompt, reusing the round's summary if no files changed since
+        _, workspace_summary = self._get_workspace_views()
         reflection_prompt = f"""
 🤔 REFLECTION PHASE - After Round {round_num}
 
@@ -583,26 +787,22 @@ Each agent should reflect on the work from their perspective and suggest improve
 """
         
         try:
-            # Run reflection conversation
-            reflection_result = await self._run_monitored_group_chat(reflection_prompt, round_num)
-            
-            # Log reflection results
+            # Run reflection conversation and log its messages as they arrive
             reflection_messages = []
-            if hasattr(reflection_result, 'messages'):
-                for message in reflection_result.messages:
-                    msg_data = {
-                        "sender": message.source,
-                        "content": message.content,
-                        "type": "reflection"
-                    }
-                    reflection_messages.append(msg_data)
-                    
-                    # Update progress display
-                    if self.progress_display:
-                        self.progress_display.agent_sent_message(
-                            message.source, 
-                            f"[REFLECTION] {message.content}"
-                        )
+            async for message in self._run_monitored_group_chat(reflection_prompt, round_num):
+                msg_data = {
+                    "sender": message.source,
+                    "content": message.content,
+                    "type": "reflection"
+                }
+                reflection_messages.append(msg_data)
+                
+                # Update progress display
+                if self.progress_display:
+                    self.progress_display.agent_sent_message(
+                        message.source, 
+                        f"[REFLECTION] {message.content}"
+                    )
             
             # Save reflection logs
             self.project_manager.logs.log_conversation(
@@ -620,13 +820,13 @@ Each agent should reflect on the work from their perspective and suggest improve
     
     async def get_final_summary(self) -> Dict[str, Any]:
         """Get a final summary of the development session."""
-        project_summary = self.project_manager.create_project_summary()
+        project_summary = self.project_manager.create_project_summary().to_dict()
         
         # Add squad-specific information
         squad_summary = {
             "squad_profile": self.squad_profile.profile,
             "agents_used": [agent.name for agent in self.agents],
-            "total_messages": len(self.conversation_history),
+            "total_messages": self._total_messages,
             "model_used": self.model
         }
         
@@ -645,16 +845,36 @@ Each agent should reflect on the work from their perspective and suggest improve
     
     async def cleanup(self):
         """Cleanup resources."""
-        # Stop progress display
-        if self.progress_display:
-            self.progress_display.stop_live_display()
+        await self._await_pending_reflection()
+        
+        # Drain pending round saves, then stop the writer
+        if self._save_task:
+            await self._save_queue.join()
+            self._save_task.cancel()
+            try:
+                await self._save_task
+            except asyncio.CancelledError:
+                pass
+            self._save_task = None
+        
+        # Write out any buffered agent actions and sync them to disk
+        self.project_manager.logs.flush(sync=True)
+        
+        # Stop progress display (skipping anything that was never created)
+        progress_display = self.__dict__.get("progress_display")
+        if progress_display:
+            progress_display.stop_live_display()
         
         # Close model client if needed
-        if hasattr(self.model_client, 'close'):
-            await self.model_client.close()
+        model_client = self.__dict__.get("model_client")
+        if hasattr(model_client, 'close'):
+            await model_client.close()
         
         if self.verbose:
             print("Squad orchestrator cleanup completed")
+        
+        # A save that failed after the last round is still an error for the caller
+        self._raise_save_error()
 
     async def test_progress_system(self):
         """Test the progress tracking system without making API calls."""
@@ -695,6 +915,49 @@ Each agent should reflect on the work from their perspective and suggest improve
         await asyncio.sleep(3)  # Let the display show updates
 
 
+class _DebugOrchestrator(SquadOrchestrator):
+    """Orchestrator specialization that simulates token usage for debug runs."""
+    
+    def _simulate_initial_tokens(self) -> None:
+        initial_tokens = 300  # Simulate initial prompt tokens
+        initial_cost = initial_tokens * 0.00015 / 1000  # GPT-4o-mini rate
+        self.token_optimizer.track_api_call(
+            input_tokens=initial_tokens,
+            output_tokens=0,
+            cost_estimate=initial_cost
+        )
+        usage_summary = self.token_optimizer.get_usage_summary()
+        self.progress_display.update_token_usage(
+            usage_summary["total_tokens_used"],
+            usage_summary["estimated_cost_usd"]
+        )
+        if self.verbose:
+            print(f"[DEBUG] Initial token simulation: {initial_tokens} tokens, ${initial_cost:.6f}")
+    
+    def _dispatch_progress(self, agent_name: str, event_type: str, *args) -> None:
+        if self.verbose:
+            print(f"[DEBUG] Progress callback: {agent_name} -> {event_type}: {args}")
+        super()._dispatch_progress(agent_name, event_type, *args)
+    
+    def _simulate_round_tokens(self, messages: List[_RoundMessage], round_tokens: int) -> int:
+        # Simulate realistic token usage for the conversation
+        estimated_tokens = len(messages) * 150  # Rough estimate per message
+        round_tokens = max(round_tokens, estimated_tokens)
+        
+        if self.verbose:
+            print(f"[DEBUG] Simulated token usage: {round_tokens} tokens for {len(messages)} messages")
+        return round_tokens
+    
+    def _monitor_usage(self, update_count: int) -> Tuple[int, float]:
+        # Simulate gradual token accumulation
+        simulated_tokens = update_count * 200  # 200 tokens per monitor wake-up
+        simulated_cost = simulated_tokens * 0.00015 / 1000  # GPT-4o-mini input rate
+        
+        if self.verbose:
+            print(f"[DEBUG] Simulated token progress: +{simulated_tokens} tokens, ${simulated_cost:.6f}")
+        return self.token_optimizer.total_tokens_used + simulated_tokens, simulated_cost
+
+
 # Utility function for creating orchestrators
 async def create_squad_orchestrator(
     project_path: str,
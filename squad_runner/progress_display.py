@@ -3,18 +3,56 @@ Real-time progress display for AutoSquad - show agent conversations and actions
 """
 
 import asyncio
+import itertools
+import sys
+import threading
 import time
-from typing import Dict, Any, List, Optional, Callable
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Callable
 from datetime import datetime
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.live import Live
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
-from rich.layout import Layout
-from rich.text import Text
-from rich.align import Align
 from collections import deque
+from types import SimpleNamespace
+
+# Rich is imported lazily where rendering happens, keeping this module cheap to import
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.layout import Layout
+    from rich.live import Live
+    from rich.panel import Panel
+    from rich.table import Table
+
+
+# Seconds after its last activity that an idle agent goes from "Recent" to "Waiting"
+_RECENT_WINDOW = 30.0
+
+
+# Queued agent events re-signal the render thread once this many are waiting
+_PENDING_FLUSH_SIZE = 256
+
+
+# Number of activity log entries shown in the conversation panel
+_CONVERSATION_TAIL = 20
+
+
+# Activity log entry templates, formatted only when the conversation panel is painted
+_LOG_STARTED = "🤖 {agent} started: {payload}"
+_LOG_COMPLETED = "✅ {agent} completed: {payload}"
+_LOG_MESSAGE = "💬 {agent}: {payload}"
+_LOG_FILE = "📄 {agent} {payload[0]}: {payload[1]}"
+
+
+# DEC private mode 2026: terminals that support it paint everything between these atomically
+_SYNC_OUTPUT_BEGIN = "\x1b[?2026h"
+_SYNC_OUTPUT_END = "\x1b[?2026l"
+
+
+def _shorten(name: str, limit: int = 20) -> str:
+    """Shorten an agent name for display in the agents table."""
+    if len(name) <= limit:
+        return name
+    name = name.replace("_", " ").replace("Engineer", "Eng").replace("Manager", "Mgr")
+    if len(name) > limit:
+        name = name[:limit - 3] + "..."
+    return name
 
 
 class AgentProgressTracker:
@@ -23,10 +61,11 @@ class AgentProgressTracker:
     def __init__(self, agent_name: str, agent_type: str):
         self.agent_name = agent_name
         self.agent_type = agent_type
+        self.display_name = _shorten(agent_name)
         self.current_action = "Waiting..."
         self.actions_completed = 0
         self.last_message = ""
-        self.last_activity = datetime.now()
+        self.last_activity = time.monotonic()
         self.is_active = False
         self.files_created = 0
         self.files_modified = 0
@@ -34,7 +73,7 @@ class AgentProgressTracker:
     def update_action(self, action: str):
         """Update the current action for this agent."""
         self.current_action = action
-        self.last_activity = datetime.now()
+        self.last_activity = time.monotonic()
         self.is_active = True
         
     def complete_action(self):
@@ -45,23 +84,30 @@ class AgentProgressTracker:
     def update_message(self, message: str):
         """Update the last message from this agent."""
         self.last_message = message[:200] + "..." if len(message) > 200 else message
-        self.last_activity = datetime.now()
+        self.last_activity = time.monotonic()
         
-    def file_operation(self, operation_type: str):
-        """Record a file operation."""
+    def file_operation(self, operation_type: str) -> bool:
+        """Record a file operation, returning whether it was counted."""
         if operation_type == "create":
             self.files_created += 1
         elif operation_type == "modify":
             self.files_modified += 1
+        else:
+            return False
+        return True
 
 
 class LiveProgressDisplay:
     """Live terminal display for AutoSquad progress."""
     
-    def __init__(self, console: Console = None):
+    def __init__(self, console: "Console" = None, debug_mode: bool = False):
+        from rich.console import Console
+        
         self.console = console or Console()
+        self.debug_mode = debug_mode
         self.agents: Dict[str, AgentProgressTracker] = {}
-        self.conversation_log = deque(maxlen=50)  # Keep last 50 messages
+        # Last 50 activity entries as (timestamp, template, agent_name, payload)
+        self.conversation_log = deque(maxlen=50)
         self.round_info = {"current": 1, "total": 3}
         self.project_info = {"name": "", "files_created": 0}
         self.token_info = {"used": 0, "estimated_cost": 0.0}
@@ -69,59 +115,191 @@ class LiveProgressDisplay:
         self.live_display = None
         self.is_running = False
         
+        # Aggregates maintained incrementally so rendering never re-scans all agents
+        self._active_count = 0
+        self._total_actions = 0
+        self._total_files = 0
+        
+        # Rendered panels are cached per layout section and rebuilt only when dirty
+        self._dirty = {"header": True, "agents": True, "conversation": True, "footer": True}
+        self._cached: Dict[str, "Panel"] = {}
+        # Wakes the render thread as soon as any section changes
+        self._dirty_event = threading.Event()
+        # Guards display state shared between the event loop and the render thread
+        self._state_lock = threading.RLock()
+        # Agent events queued by producers and applied in batches by the render thread
+        self._pending: List[tuple] = []
+        self._pending_lock = threading.Lock()
+        self._render_thread: Optional[threading.Thread] = None
+        # Shutdown signals: one for the render thread's waits, one for the awaiting coroutine
+        self._stop_event = threading.Event()
+        self._stopped: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Last formatted (second, "HH:MM:SS") pair; log entries cluster within the same second
+        self._hms_cache = (-1, "")
+        # Per-agent one-shot timers that repaint when an agent stops being "Recent"
+        self._idle_timers: Dict[str, asyncio.TimerHandle] = {}
+        
+    def _mark_dirty(self, *sections: str):
+        """Flag layout sections whose panels need to be re-rendered."""
+        for section in sections:
+            self._dirty[section] = True
+        self._dirty_event.set()
+        
+    def _schedule_idle_repaint(self, agent_name: str):
+        """Repaint the agents panel once the agent's "Recent" status expires."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        previous = self._idle_timers.get(agent_name)
+        if previous is not None:
+            previous.cancel()
+        # Small margin so the repaint lands after the batched event has been applied
+        self._idle_timers[agent_name] = loop.call_later(_RECENT_WINDOW + 0.5, self._mark_dirty, "agents")
+        
     def register_agent(self, agent_name: str, agent_type: str):
         """Register an agent for tracking."""
-        self.agents[agent_name] = AgentProgressTracker(agent_name, agent_type)
+        # Interned so event lookups with the same name hit the identity fast path
+        agent_name = sys.intern(agent_name)
+        with self._state_lock:
+            previous = self.agents.get(agent_name)
+            if previous is not None:
+                self._active_count -= previous.is_active
+                self._total_actions -= previous.actions_completed
+                self._total_files -= previous.files_created + previous.files_modified
+            self.agents[agent_name] = AgentProgressTracker(agent_name, agent_type)
+        self._mark_dirty("agents", "footer")
+        
+    def _dispatch(self, agent_name: str, handler: Callable, *args):
+        """Queue an agent event for the render thread, or apply it now when not rendering."""
+        if not self.is_running:
+            with self._state_lock:
+                self._apply_event(agent_name, handler, args)
+            return
+        with self._pending_lock:
+            self._pending.append((agent_name, handler, args))
+            queued = len(self._pending)
+        # Never drain here: that takes the state lock the render thread holds while
+        # painting, which would block the event loop on terminal I/O
+        if queued == 1 or queued % _PENDING_FLUSH_SIZE == 0:
+            self._dirty_event.set()
+            
+    def _apply_event(self, agent_name: str, handler: Callable, args: tuple):
+        """Apply an event to a registered agent's tracker; unknown agents are ignored."""
+        agent = self.agents.get(agent_name)
+        if agent is not None:
+            handler(agent, *args)
+            
+    def _drain_pending(self):
+        """Apply all queued agent events in one pass."""
+        # Swapping under the state lock keeps batches applied in arrival order
+        with self._state_lock:
+            with self._pending_lock:
+                if not self._pending:
+                    return
+                events, self._pending = self._pending, []
+            for agent_name, handler, args in events:
+                self._apply_event(agent_name, handler, args)
         
     def agent_started_action(self, agent_name: str, action: str):
         """Mark that an agent started an action."""
-        if agent_name in self.agents:
-            self.agents[agent_name].update_action(action)
-            self._log_activity(f"🤖 {agent_name} started: {action}")
+        # Events for unregistered agents (e.g. "System") are dropped before any scheduling
+        if agent_name not in self.agents:
+            return
+        self._schedule_idle_repaint(agent_name)
+        self._dispatch(agent_name, self._apply_action_started, action)
             
     def agent_completed_action(self, agent_name: str, result: str = ""):
         """Mark that an agent completed their current action."""
-        if agent_name in self.agents:
-            self.agents[agent_name].complete_action()
-            if result:
-                self._log_activity(f"✅ {agent_name} completed: {result}")
+        if agent_name not in self.agents:
+            return
+        self._dispatch(agent_name, self._apply_action_completed, result)
                 
     def agent_sent_message(self, agent_name: str, message: str):
         """Record a message from an agent."""
-        if agent_name in self.agents:
-            self.agents[agent_name].update_message(message)
-            # Log a truncated version
-            short_message = message[:100] + "..." if len(message) > 100 else message
-            self._log_activity(f"💬 {agent_name}: {short_message}")
+        if agent_name not in self.agents:
+            return
+        self._schedule_idle_repaint(agent_name)
+        # Truncate once up front so only the short previews are queued and retained
+        if len(message) > 100:
+            log_preview = message[:100] + "..."
+            if len(message) > 200:
+                message = message[:200] + "..."
+        else:
+            log_preview = message
+        self._dispatch(agent_name, self._apply_message, message, log_preview)
             
     def agent_file_operation(self, agent_name: str, operation: str, file_path: str):
         """Record a file operation by an agent."""
-        if agent_name in self.agents:
-            self.agents[agent_name].file_operation(operation)
-            self.project_info["files_created"] += 1
-            self._log_activity(f"📄 {agent_name} {operation}: {file_path}")
+        if agent_name not in self.agents:
+            return
+        self._dispatch(agent_name, self._apply_file_operation, operation, file_path)
+        
+    def _apply_action_started(self, agent: AgentProgressTracker, action: str):
+        if not agent.is_active:
+            self._active_count += 1
+        agent.update_action(action)
+        self._mark_dirty("agents", "footer")
+        self._log_activity(_LOG_STARTED, agent.agent_name, action)
+        
+    def _apply_action_completed(self, agent: AgentProgressTracker, result: str):
+        if agent.is_active:
+            self._active_count -= 1
+        self._total_actions += 1
+        agent.complete_action()
+        self._mark_dirty("agents", "footer")
+        if result:
+            self._log_activity(_LOG_COMPLETED, agent.agent_name, result)
+        
+    def _apply_message(self, agent: AgentProgressTracker, preview: str, log_preview: str):
+        # The preview is already truncated, so skip update_message's own length check
+        agent.last_message = preview
+        agent.last_activity = time.monotonic()
+        self._mark_dirty("agents")
+        self._log_activity(_LOG_MESSAGE, agent.agent_name, log_preview)
+        
+    def _apply_file_operation(self, agent: AgentProgressTracker, operation: str, file_path: str):
+        if agent.file_operation(operation):
+            self._total_files += 1
+        self.project_info["files_created"] += 1
+        self._mark_dirty("header", "agents", "footer")
+        self._log_activity(_LOG_FILE, agent.agent_name, (operation, file_path))
             
     def update_round_info(self, current_round: int, total_rounds: int):
         """Update round information."""
         self.round_info = {"current": current_round, "total": total_rounds}
+        self._mark_dirty("header")
         
     def update_token_usage(self, tokens_used: int, estimated_cost: float):
         """Update token usage information."""
         self.token_info = {"used": tokens_used, "estimated_cost": estimated_cost}
+        self._mark_dirty("header", "footer")
         
     def update_project_info(self, project_name: str, files_created: int = None):
         """Update project information."""
         self.project_info["name"] = project_name
         if files_created is not None:
             self.project_info["files_created"] = files_created
+        self._mark_dirty("header")
             
-    def _log_activity(self, message: str):
-        """Add an activity message to the log."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.conversation_log.append(f"[dim]{timestamp}[/dim] {message}")
+    def _log_activity(self, template: str, agent_name: str, payload: Any):
+        """Add an activity entry to the log; formatting is deferred to render time."""
+        with self._state_lock:
+            self.conversation_log.append((time.time(), template, agent_name, payload))
+        self._mark_dirty("conversation")
         
-    def _create_main_layout(self) -> Layout:
+    def _format_hms(self, timestamp: float) -> str:
+        """Format a timestamp as HH:MM:SS, reusing the string while the second is unchanged."""
+        second = int(timestamp)
+        if second != self._hms_cache[0]:
+            self._hms_cache = (second, time.strftime("%H:%M:%S", time.localtime(second)))
+        return self._hms_cache[1]
+        
+    def _create_main_layout(self) -> "Layout":
         """Create the main layout for the live display."""
+        from rich.layout import Layout
+        
         layout = Layout()
         
         # Split into header, main content, and footer
@@ -139,16 +317,21 @@ class LiveProgressDisplay:
         
         return layout
         
-    def _render_header(self) -> Panel:
+    def _render_header(self) -> "Panel":
         """Render the header with project and round info."""
-        elapsed = datetime.now() - self.start_time
-        elapsed_str = f"{int(elapsed.total_seconds() // 60)}m {int(elapsed.total_seconds() % 60)}s"
+        from rich.panel import Panel
+        from rich.text import Text
+        
+        minutes, seconds = divmod(int((datetime.now() - self.start_time).total_seconds()), 60)
         
         title = f"🧠 AutoSquad - {self.project_info['name']}"
-        content = f"Round {self.round_info['current']}/{self.round_info['total']} | "
-        content += f"Elapsed: {elapsed_str} | "
-        content += f"Files: {self.project_info['files_created']} | "
-        content += f"Tokens: {self.token_info['used']:,} (~${self.token_info['estimated_cost']:.3f})"
+        content = Text.assemble(
+            "Round ", str(self.round_info['current']), "/", str(self.round_info['total']),
+            " | Elapsed: ", str(minutes), "m ", str(seconds), "s",
+            " | Files: ", str(self.project_info['files_created']),
+            " | Tokens: ", format(self.token_info['used'], ","),
+            " (~$", format(self.token_info['estimated_cost'], ".3f"), ")"
+        )
         
         return Panel(
             content,
@@ -157,31 +340,35 @@ class LiveProgressDisplay:
             padding=(0, 1)
         )
         
-    def _render_agents_panel(self) -> Panel:
-        """Render the agents status panel."""
-        if not self.agents:
-            return Panel("No agents registered", title="🤖 Agents", border_style="yellow")
-            
+    @staticmethod
+    def _new_agents_table() -> "Table":
+        """Build the agents table with its column layout."""
+        from rich.table import Table
+        
         table = Table(show_header=True, header_style="bold magenta")
         table.add_column("Agent", style="cyan", min_width=15)  # Ensure minimum width
         table.add_column("Status", width=12)
         table.add_column("Current Action", style="green", min_width=20)
         table.add_column("Progress", justify="right", width=12)
+        return table
         
-        for agent in self.agents.values():
-            # Shorten agent name for display
-            display_name = agent.agent_name
-            if len(display_name) > 20:
-                display_name = display_name.replace("_", " ").replace("Engineer", "Eng").replace("Manager", "Mgr")
-                if len(display_name) > 20:
-                    display_name = display_name[:17] + "..."
+    def _render_agents_panel(self) -> "Panel":
+        """Render the agents status panel."""
+        from rich.panel import Panel
+        
+        if not self.agents:
+            return Panel("No agents registered", title="🤖 Agents", border_style="yellow")
             
+        # A fresh table per frame: Live may re-render the previous one from another thread
+        table = self._new_agents_table()
+        
+        now = time.monotonic()
+        for agent in self.agents.values():
             # Agent status
             if agent.is_active:
                 status = "[green]🟢 Active[/green]"
             else:
-                idle_time = (datetime.now() - agent.last_activity).total_seconds()
-                if idle_time < 30:
+                if now - agent.last_activity < _RECENT_WINDOW:
                     status = "[yellow]🟡 Recent[/yellow]"
                 else:
                     status = "[dim]⚪ Waiting[/dim]"
@@ -199,7 +386,7 @@ class LiveProgressDisplay:
                 progress = f"{agent.actions_completed} actions"
                 
             table.add_row(
-                display_name,
+                agent.display_name,
                 status,
                 action,
                 progress
@@ -207,13 +394,23 @@ class LiveProgressDisplay:
             
         return Panel(table, title="🤖 Agent Status", border_style="green")
         
-    def _render_conversation_panel(self) -> Panel:
+    def _render_conversation_panel(self) -> "Panel":
         """Render the conversation/activity log panel."""
+        from rich.panel import Panel
+        
         if not self.conversation_log:
             content = "[dim]No activity yet...[/dim]"
         else:
-            # Show recent messages, newest at bottom
-            content = "\n".join(list(self.conversation_log)[-20:])  # Last 20 lines
+            # Walk back from the newest entry so only the visible tail is touched,
+            # then flip it so the newest line is at the bottom
+            lines = [
+                f"[dim]{self._format_hms(timestamp)}[/dim] "
+                + template.format(agent=agent_name, payload=payload)
+                for timestamp, template, agent_name, payload
+                in itertools.islice(reversed(self.conversation_log), _CONVERSATION_TAIL)
+            ]
+            lines.reverse()
+            content = "\n".join(lines)
             
         return Panel(
             content,
@@ -222,8 +419,10 @@ class LiveProgressDisplay:
             height=None
         )
         
-    def _render_footer(self) -> Panel:
+    def _render_footer(self) -> "Panel":
         """Render the footer with token usage and performance info."""
+        from rich.panel import Panel
+        
         # Token usage info with better formatting for small costs
         cost = self.token_info['estimated_cost']
         if cost < 0.001:
@@ -234,10 +433,10 @@ class LiveProgressDisplay:
         token_line = f"Token Usage: {self.token_info['used']:,} tokens | Est. Cost: {cost_str}"
         
         # Performance info
-        active_agents = sum(1 for agent in self.agents.values() if agent.is_active)
-        total_actions = sum(agent.actions_completed for agent in self.agents.values())
-        total_files = sum(agent.files_created + agent.files_modified for agent in self.agents.values())
-        performance_line = f"Active Agents: {active_agents}/{len(self.agents)} | Total Actions: {total_actions} | Files: {total_files}"
+        performance_line = (
+            f"Active Agents: {self._active_count}/{len(self.agents)} | "
+            f"Total Actions: {self._total_actions} | Files: {self._total_files}"
+        )
         
         # Instructions
         instructions = "[dim]Press Ctrl+C to stop | Logs saved to project/logs/[/dim]"
@@ -252,33 +451,43 @@ class LiveProgressDisplay:
         )
         
     async def start_live_display(self):
-        """Start the live display."""        
+        """Start the live display.
+        
+        Painting happens on a dedicated render thread so Rich render cost never
+        delays agent callbacks on the event loop; this coroutine only waits for
+        the display to be stopped.
+        """
         if self.is_running:
             return
             
+        from rich.live import Live
+        
         self.is_running = True
+        self._stop_event.clear()
+        self._stopped = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
         layout = self._create_main_layout()
         
         try:
             # Use non-screen mode for better terminal compatibility
             with Live(layout, console=self.console, refresh_per_second=2, screen=False, auto_refresh=False) as live:
                 self.live_display = live
-                
-                while self.is_running:
-                    try:
-                        # Update layout components
-                        layout["header"].update(self._render_header())
-                        layout["agents"].update(self._render_agents_panel())
-                        layout["conversation"].update(self._render_conversation_panel())
-                        layout["footer"].update(self._render_footer())
-                        
-                        # Manual refresh
-                        live.refresh()
-                        await asyncio.sleep(0.5)  # Update every 500ms
-                    except Exception as e:
-                        # Log error and continue
-                        print(f"Display error: {e}", flush=True)
-                        await asyncio.sleep(1.0)
+                self._render_thread = threading.Thread(
+                    target=self._render_loop,
+                    args=(live, layout),
+                    name="autosquad-live-display",
+                    daemon=True
+                )
+                self._render_thread.start()
+                try:
+                    await self._stopped.wait()
+                finally:
+                    self.is_running = False
+                    self._stop_event.set()
+                    self._dirty_event.set()
+                    self._render_thread.join(timeout=2.0)
+                    self._render_thread = None
+                    self._drain_pending()
                         
         except asyncio.CancelledError:
             raise
@@ -287,22 +496,87 @@ class LiveProgressDisplay:
         finally:
             self.is_running = False
             self.live_display = None
+            
+    def _render_loop(self, live: "Live", layout: "Layout"):
+        """Repaint dirty sections until the display stops (runs on the render thread)."""
+        renderers = (
+            ("header", self._render_header),
+            ("agents", self._render_agents_panel),
+            ("conversation", self._render_conversation_panel),
+            ("footer", self._render_footer),
+        )
+        # Unsupporting terminals ignore the mode, but don't leak it into redirected output
+        synchronized = self.console.is_terminal
+        
+        while not self._stop_event.is_set():
+            try:
+                # Flags are cleared before rendering so a mutation made mid-render
+                # marks its section dirty again and wakes the next cycle
+                self._dirty_event.clear()
+                self._drain_pending()
+                
+                # Rebuild only the panels whose inputs changed
+                with self._state_lock:
+                    for section, render in renderers:
+                        if self._dirty[section]:
+                            self._dirty[section] = False
+                            self._cached[section] = render()
+                            layout[section].update(self._cached[section])
+                
+                # The header shows elapsed time, so it is refreshed every tick
+                self._dirty["header"] = True
+                
+                # Single manual refresh per cycle, wrapped in synchronized output
+                if synchronized:
+                    self.console.file.write(_SYNC_OUTPUT_BEGIN)
+                live.refresh()
+                if synchronized:
+                    self.console.file.write(_SYNC_OUTPUT_END)
+                    self.console.file.flush()
+                
+                # Wait for a change (or the next clock tick), then let bursts coalesce
+                self._dirty_event.wait(timeout=1.0)
+                self._stop_event.wait(0.016)
+            except Exception as e:
+                # Log error and continue
+                print(f"Display error: {e}", flush=True)
+                self._stop_event.wait(1.0)
                 
     def stop_live_display(self):
         """Stop the live display."""
         self.is_running = False
+        for timer in self._idle_timers.values():
+            timer.cancel()
+        self._idle_timers.clear()
+        self._dirty_event.set()
+        self._stop_event.set()
+        if self._stopped is not None and not self._loop.is_closed():
+            # Safe whether called from the event loop or another thread
+            self._loop.call_soon_threadsafe(self._stopped.set)
         
-    def display_summary(self) -> Panel:
+    def display_summary(self) -> "Panel":
         """Display a final summary when complete."""
-        total_actions = sum(agent.actions_completed for agent in self.agents.values())
-        total_files = sum(agent.files_created + agent.files_modified for agent in self.agents.values())
-        elapsed = datetime.now() - self.start_time
+        from rich.panel import Panel
+        from rich.table import Table
+        
+        self._drain_pending()
+        total_actions = self._total_actions
+        total_files = self._total_files
+        if self.debug_mode:
+            # Consistency check for the incremental counters; report drift and show the recount
+            actions = sum(agent.actions_completed for agent in self.agents.values())
+            files = sum(agent.files_created + agent.files_modified for agent in self.agents.values())
+            if (actions, files) != (total_actions, total_files):
+                print(f"[DEBUG] Progress counters drifted: actions {total_actions} != {actions}, "
+                      f"files {total_files} != {files}")
+                total_actions, total_files = actions, files
+        minutes, seconds = divmod(int((datetime.now() - self.start_time).total_seconds()), 60)
         
         summary_table = Table(show_header=False)
         summary_table.add_column("Metric", style="cyan")
         summary_table.add_column("Value", style="green")
         
-        summary_table.add_row("Total Runtime", f"{int(elapsed.total_seconds() // 60)}m {int(elapsed.total_seconds() % 60)}s")
+        summary_table.add_row("Total Runtime", f"{minutes}m {seconds}s")
         summary_table.add_row("Rounds Completed", str(self.round_info["current"]))
         summary_table.add_row("Actions Taken", str(total_actions))
         summary_table.add_row("Files Created/Modified", str(total_files))
@@ -316,13 +590,20 @@ class LiveProgressDisplay:
         )
 
 
-def create_progress_callback(display: LiveProgressDisplay) -> Dict[str, Callable]:
-    """Create callback functions for progress tracking."""
-    return {
-        "agent_action_started": display.agent_started_action,
-        "agent_action_completed": display.agent_completed_action,
-        "agent_message": display.agent_sent_message,
-        "file_operation": display.agent_file_operation,
-        "round_update": display.update_round_info,
-        "token_update": display.update_token_usage
-    } 
\ No newline at end of file
+def create_progress_callback(display: LiveProgressDisplay) -> SimpleNamespace:
+    """Create callback functions for progress tracking, exposed as attributes."""
+    return SimpleNamespace(
+        agent_action_started=display.agent_started_action,
+        agent_action_completed=display.agent_completed_action,
+        agent_message=display.agent_sent_message,
+        file_operation=display.agent_file_operation,
+        round_update=display.update_round_info,
+        token_update=display.update_token_usage
+    )
+
+
+__all__ = [
+    "AgentProgressTracker",
+    "LiveProgressDisplay",
+    "create_progress_callback"
+]
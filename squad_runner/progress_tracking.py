@@ -2,18 +2,107 @@
 Progress Tracking Module - Tracks and persists squad execution progress
 """
 
+import atexit
+import itertools
 import json
+import mmap
+import os
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, BarColumn, TextColumn, TimeElapsedColumn, SpinnerColumn
-from rich.table import Table
+if TYPE_CHECKING:
+    from rich.table import Table
 
-console = Console()
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib encoder
+    orjson = None
+
+# Rich is imported on first display so headless callers skip its startup cost
+_console = None
+
+
+def _get_console():
+    """Return the shared console, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize progress data to indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _dumps_line(data: Dict[str, Any]) -> bytes:
+    """Serialize one event record as a compact JSON line."""
+    if orjson is not None:
+        return orjson.dumps(data) + b"\n"
+    return json.dumps(data, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def _loads(data: bytes) -> Dict[str, Any]:
+    """Parse progress data from JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _event_time(record: Dict[str, Any]) -> datetime:
+    """Return when an event happened; older records carry an ISO "timestamp" string."""
+    if "ts" in record:
+        return datetime.fromtimestamp(record["ts"])
+    return datetime.fromisoformat(record["timestamp"])
+
+
+def _iter_lines(path: Path) -> Iterator[bytes]:
+    """Yield the lines of a file through a read-only memory map."""
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        if os.fstat(fd).st_size == 0:
+            return  # Empty files cannot be mapped
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+            line = mm.readline()
+            while line:
+                yield line
+                line = mm.readline()
+    finally:
+        os.close(fd)
+
+
+# Buffered progress changes are flushed after this many mutations or seconds
+_FLUSH_EVERY_OPS = 32
+_FLUSH_INTERVAL = 2.0
+
+# Threads used to read session summaries in list_active_sessions
+_SUMMARY_WORKERS = 16
+
+# Scalar fields needed to list sessions without loading their history
+_SUMMARY_FIELDS = ("session_name", "rounds_completed", "total_rounds", "current_round", "current_task", "start_time")
+
+# Event kinds in events.jsonl and the in-memory history list each one replays into
+_EVENT_LISTS = {
+    "round": "round_times",
+    "interaction": "agent_interactions",
+    "error": "errors",
+    "milestone": "milestones",
+}
+
+# In-memory history is capped; events.jsonl keeps the full record
+_HISTORY_LIMITS = {
+    "round_times": 500,
+    "agent_interactions": 200,
+    "errors": 100,
+    "milestones": 100,
+}
 
 
 class ProgressTracker:
@@ -24,6 +113,7 @@ class ProgressTracker:
         self.project_path = project_path
         self.session_dir = project_path / ".autosquad" / "sessions" / session_name
         self.progress_file = self.session_dir / "progress.json"
+        self.events_file = self.session_dir / "events.jsonl"
         
         # Progress state
         self.rounds_completed = 0
@@ -32,10 +122,21 @@ class ProgressTracker:
         self.current_agent = ""
         self.current_task = ""
         self.start_time = None
-        self.round_times = []
-        self.agent_interactions = []
-        self.errors = []
-        self.milestones = []
+        self.round_times = deque(maxlen=_HISTORY_LIMITS["round_times"])
+        self.agent_interactions = deque(maxlen=_HISTORY_LIMITS["agent_interactions"])
+        self.errors = deque(maxlen=_HISTORY_LIMITS["errors"])
+        self.milestones = deque(maxlen=_HISTORY_LIMITS["milestones"])
+        
+        # Write coalescing: mutations mark state dirty and flush in batches
+        self._dirty = False
+        self._pending_ops = 0
+        self._last_flush = time.monotonic()
+        self._exit_hook_registered = False
+        
+        # History events are appended to events.jsonl; opened on the first write
+        self._events_fp = None
+        # Full history read from a legacy progress.json, pending its move to events.jsonl
+        self._legacy_history: Dict[str, List[Dict[str, Any]]] = {}
         
         # Load existing progress if available
         self.load_progress()
@@ -44,7 +145,7 @@ class ProgressTracker:
         """Initialize progress tracking for a new session."""
         self.total_rounds = total_rounds
         self.start_time = datetime.now()
-        self.save_progress()
+        self.checkpoint()
     
     def start_round(self, round_number: int) -> None:
         """Mark the start of a new round."""
@@ -57,15 +158,15 @@ class ProgressTracker:
         """Mark the end of a round."""
         if hasattr(self, 'round_start_time'):
             round_duration = time.time() - self.round_start_time
-            self.round_times.append({
+            self._record_event("round", {
                 "round": round_number,
                 "duration": round_duration,
-                "completed_at": datetime.now().isoformat()
+                "ts": time.time()
             })
         
         self.rounds_completed = round_number
         self.current_task = f"Round {round_number} completed"
-        self.save_progress()
+        self.checkpoint()
     
     def set_current_agent(self, agent_name: str, task: str = "") -> None:
         """Update current agent and task."""
@@ -76,38 +177,66 @@ class ProgressTracker:
     def add_agent_interaction(self, agent: str, message_type: str, message_count: int) -> None:
         """Record an agent interaction."""
         interaction = {
-            "timestamp": datetime.now().isoformat(),
+            "ts": time.time(),
             "agent": agent,
             "type": message_type,
             "count": message_count,
             "round": self.current_round
         }
-        self.agent_interactions.append(interaction)
+        self._record_event("interaction", interaction)
         self.save_progress()
     
     def add_milestone(self, title: str, description: str) -> None:
         """Add a milestone to track significant progress points."""
         milestone = {
-            "timestamp": datetime.now().isoformat(),
+            "ts": time.time(),
             "title": title,
             "description": description,
             "round": self.current_round
         }
-        self.milestones.append(milestone)
+        self._record_event("milestone", milestone)
         self.save_progress()
     
     def add_error(self, error_type: str, error_message: str) -> None:
         """Record an error for troubleshooting."""
         error = {
-            "timestamp": datetime.now().isoformat(),
+            "ts": time.time(),
             "type": error_type,
             "message": error_message,
             "round": self.current_round,
             "agent": self.current_agent
         }
-        self.errors.append(error)
+        self._record_event("error", error)
         self.save_progress()
     
+    def _record_event(self, kind: str, record: Dict[str, Any]) -> None:
+        """Append a history event to events.jsonl and the matching in-memory list."""
+        self._open_events().write(_dumps_line({"kind": kind, **record}))
+        getattr(self, _EVENT_LISTS[kind]).append(record)
+    
+    def _open_events(self):
+        """Open events.jsonl for appending, migrating history from legacy progress files."""
+        if self._events_fp is None:
+            self.session_dir.mkdir(parents=True, exist_ok=True)
+            self._events_fp = open(self.events_file, "ab", buffering=64 * 1024)
+            if self._legacy_history:
+                # Older progress.json files embedded the full history; move it to the log
+                for kind, records in self._legacy_history.items():
+                    for record in records:
+                        self._events_fp.write(_dumps_line({"kind": kind, **record}))
+                self._legacy_history = {}
+        return self._events_fp
+    
+    def close(self) -> None:
+        """Flush pending progress and close the event log."""
+        self._flush_if_dirty()
+        if self._exit_hook_registered:
+            atexit.unregister(self._flush_if_dirty)
+            self._exit_hook_registered = False
+        if self._events_fp is not None:
+            self._events_fp.close()
+            self._events_fp = None
+    
     def get_estimated_completion(self) -> Optional[datetime]:
         """Estimate completion time based on round durations."""
         if not self.round_times or self.rounds_completed == 0:
@@ -123,6 +252,12 @@ class ProgressTracker:
         
         return datetime.now() + timedelta(seconds=estimated_remaining_seconds)
     
+    @staticmethod
+    def read_summary(progress_file: Path) -> Dict[str, Any]:
+        """Read only the scalar session fields from a progress file."""
+        progress_data = _loads(progress_file.read_bytes())
+        return {field: progress_data.get(field) for field in _SUMMARY_FIELDS}
+    
     def get_progress_percentage(self) -> float:
         """Get completion percentage."""
         if self.total_rounds == 0:
@@ -130,8 +265,35 @@ class ProgressTracker:
         return (self.rounds_completed / self.total_rounds) * 100
     
     def save_progress(self) -> None:
-        """Save progress state to file."""
+        """Record a progress change, writing it out once enough changes or time accumulate."""
+        self._dirty = True
+        self._pending_ops += 1
+        if not self._exit_hook_registered:
+            # Registered on first change so read-only trackers never write at exit
+            atexit.register(self._flush_if_dirty)
+            self._exit_hook_registered = True
+        
+        if (self._pending_ops >= _FLUSH_EVERY_OPS
+                or time.monotonic() - self._last_flush >= _FLUSH_INTERVAL):
+            self._flush_now()
+    
+    def checkpoint(self) -> None:
+        """Write progress state to file immediately and sync it to disk."""
+        self._flush_now(sync=True)
+    
+    def _flush_if_dirty(self) -> None:
+        if self._dirty:
+            self._flush_now()
+    
+    def _flush_now(self, sync: bool = False) -> None:
+        """Save scalar progress state to file and push buffered events to the OS."""
         self.session_dir.mkdir(parents=True, exist_ok=True)
+        if self._legacy_history:
+            self._open_events()
+        if self._events_fp is not None:
+            self._events_fp.flush()
+            if sync:
+                os.fsync(self._events_fp.fileno())
         
         progress_data = {
             "session_name": self.session_name,
@@ -142,14 +304,27 @@ class ProgressTracker:
             "current_agent": self.current_agent,
             "current_task": self.current_task,
             "start_time": self.start_time.isoformat() if self.start_time else None,
-            "round_times": self.round_times,
-            "agent_interactions": self.agent_interactions,
-            "errors": self.errors,
-            "milestones": self.milestones,
             "last_updated": datetime.now().isoformat()
         }
         
-        self.progress_file.write_text(json.dumps(progress_data, indent=2))
+        self._write_state(_dumps(progress_data), sync)
+        
+        self._dirty = False
+        self._pending_ops = 0
+        self._last_flush = time.monotonic()
+    
+    def _write_state(self, payload: bytes, sync: bool = False) -> None:
+        """Atomically replace progress.json, syncing the data first only when asked."""
+        tmp_file = self.progress_file.with_suffix(".json.tmp")
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+        try:
+            os.write(fd, payload)
+            if sync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        # Readers see either the previous state or the new one, never a torn file
+        os.replace(tmp_file, self.progress_file)
     
     def load_progress(self) -> None:
         """Load progress state from file."""
@@ -157,27 +332,44 @@ class ProgressTracker:
             return
         
         try:
-            progress_data = json.loads(self.progress_file.read_text())
+            progress_data = _loads(self.progress_file.read_bytes())
             
             self.rounds_completed = progress_data.get("rounds_completed", 0)
             self.total_rounds = progress_data.get("total_rounds", 0)
             self.current_round = progress_data.get("current_round", 0)
             self.current_agent = progress_data.get("current_agent", "")
             self.current_task = progress_data.get("current_task", "")
-            self.round_times = progress_data.get("round_times", [])
-            self.agent_interactions = progress_data.get("agent_interactions", [])
-            self.errors = progress_data.get("errors", [])
-            self.milestones = progress_data.get("milestones", [])
             
             start_time_str = progress_data.get("start_time")
             if start_time_str:
                 self.start_time = datetime.fromisoformat(start_time_str)
+            
+            # Legacy files carry the history inline; it moves to events.jsonl on the next write
+            for kind, attr in _EVENT_LISTS.items():
+                if attr in progress_data:
+                    getattr(self, attr).extend(progress_data[attr])
+                    self._legacy_history[kind] = progress_data[attr]
+            
+            # Replay the append-only history log
+            if self.events_file.exists():
+                for line in _iter_lines(self.events_file):
+                    try:
+                        record = _loads(line)
+                    except ValueError:
+                        # Blank or torn trailing line from an interrupted write
+                        continue
+                    attr = _EVENT_LISTS.get(record.pop("kind", None))
+                    if attr:
+                        getattr(self, attr).append(record)
                 
         except Exception as e:
-            console.print(f"[yellow]⚠️  Warning: Could not load progress data: {e}[/yellow]")
+            _get_console().print(f"[yellow]⚠️  Warning: Could not load progress data: {e}[/yellow]")
     
     def display_progress_summary(self) -> None:
         """Display a comprehensive progress summary."""
+        from rich.panel import Panel
+        
+        console = _get_console()
         console.print(Panel.fit(
             f"🧠 [bold blue]Squad Progress Summary[/bold blue]\n"
             f"📁 Project: {self.project_path.name}\n"
@@ -203,37 +395,45 @@ class ProgressTracker:
         # Show round timing
         if self.round_times:
             console.print(f"\n🔄 [bold]Round Performance:[/bold]")
-            for rt in self.round_times[-3:]:  # Show last 3 rounds
+            for rt in itertools.islice(self.round_times, max(0, len(self.round_times) - 3), None):  # Show last 3 rounds
                 duration_str = f"{rt['duration']:.1f}s"
                 console.print(f"   Round {rt['round']}: {duration_str}")
         
         # Show recent milestones
         if self.milestones:
             console.print(f"\n🎯 [bold]Recent Milestones:[/bold]")
-            for milestone in self.milestones[-3:]:  # Show last 3 milestones
+            for milestone in itertools.islice(self.milestones, max(0, len(self.milestones) - 3), None):  # Show last 3 milestones
                 console.print(f"   • {milestone['title']}")
         
         # Show errors if any
         if self.errors:
             console.print(f"\n⚠️  [bold yellow]Issues:[/bold yellow] {len(self.errors)} error(s) encountered")
     
+    @staticmethod
+    def _new_interaction_table() -> "Table":
+        """Build the agent interactions table with its column layout."""
+        from rich.table import Table
+        
+        table = Table()
+        table.add_column("Time", style="dim")
+        table.add_column("Agent", style="bold")
+        table.add_column("Type", style="cyan")
+        table.add_column("Messages", justify="right")
+        table.add_column("Round", justify="center")
+        return table
+    
     def display_detailed_progress(self) -> None:
         """Display detailed progress information."""
+        console = _get_console()
         self.display_progress_summary()
         
         # Agent interactions table
         if self.agent_interactions:
             console.print(f"\n[bold]Agent Interactions:[/bold]")
-            table = Table()
-            table.add_column("Time", style="dim")
-            table.add_column("Agent", style="bold")
-            table.add_column("Type", style="cyan")
-            table.add_column("Messages", justify="right")
-            table.add_column("Round", justify="center")
+            table = self._new_interaction_table()
             
-            for interaction in self.agent_interactions[-10:]:  # Last 10 interactions
-                timestamp = datetime.fromisoformat(interaction['timestamp'])
-                time_str = timestamp.strftime("%H:%M:%S")
+            for interaction in itertools.islice(self.agent_interactions, max(0, len(self.agent_interactions) - 10), None):  # Last 10 interactions
+                time_str = _event_time(interaction).strftime("%H:%M:%S")
                 
                 table.add_row(
                     time_str,
@@ -248,9 +448,8 @@ class ProgressTracker:
         # Error details if any
         if self.errors:
             console.print(f"\n[bold red]Errors:[/bold red]")
-            for error in self.errors[-5:]:  # Last 5 errors
-                timestamp = datetime.fromisoformat(error['timestamp'])
-                time_str = timestamp.strftime("%H:%M:%S")
+            for error in itertools.islice(self.errors, max(0, len(self.errors) - 5), None):  # Last 5 errors
+                time_str = _event_time(error).strftime("%H:%M:%S")
                 console.print(f"   {time_str} [red]{error['type']}[/red]: {error['message']}")
 
 
@@ -271,34 +470,47 @@ def get_session_progress(session_name: str, project_path: Optional[Path] = None)
     return None
 
 
+def _session_summary(session: Tuple[Path, Path]) -> Optional[Dict[str, Any]]:
+    """Summarise one session directory, or return None if it has no readable progress."""
+    project_dir, session_dir = session
+    try:
+        summary = ProgressTracker.read_summary(session_dir / "progress.json")
+        rounds_completed = summary["rounds_completed"] or 0
+        total_rounds = summary["total_rounds"] or 0
+        start_time = summary["start_time"]
+        return {
+            "session_name": session_dir.name,
+            "project": project_dir.name,
+            "progress": (rounds_completed / total_rounds) * 100 if total_rounds else 0.0,
+            "current_round": summary["current_round"] or 0,
+            "total_rounds": total_rounds,
+            "current_task": summary["current_task"] or "",
+            "start_time": datetime.fromisoformat(start_time) if start_time else None
+        }
+    except Exception:
+        return None
+
+
 def list_active_sessions() -> List[Dict[str, Any]]:
     """List all active/recent sessions with their progress."""
-    active_sessions = []
-    
     projects_dir = Path("projects")
     if not projects_dir.exists():
-        return active_sessions
+        return []
     
+    candidate_sessions = []
     for project_dir in projects_dir.iterdir():
         if project_dir.is_dir():
             sessions_dir = project_dir / ".autosquad" / "sessions"
             if sessions_dir.exists():
                 for session_dir in sessions_dir.iterdir():
                     if session_dir.is_dir():
-                        progress_file = session_dir / "progress.json"
-                        if progress_file.exists():
-                            try:
-                                tracker = ProgressTracker(session_dir.name, project_dir)
-                                active_sessions.append({
-                                    "session_name": tracker.session_name,
-                                    "project": project_dir.name,
-                                    "progress": tracker.get_progress_percentage(),
-                                    "current_round": tracker.current_round,
-                                    "total_rounds": tracker.total_rounds,
-                                    "current_task": tracker.current_task,
-                                    "start_time": tracker.start_time
-                                })
-                            except Exception:
-                                continue
+                        candidate_sessions.append((project_dir, session_dir))
+    
+    if not candidate_sessions:
+        return []
+    
+    # Summary reads are I/O-bound, so overlap them; map() keeps the directory order
+    with ThreadPoolExecutor(max_workers=min(_SUMMARY_WORKERS, len(candidate_sessions))) as executor:
+        summaries = list(executor.map(_session_summary, candidate_sessions))
     
-    return active_sessions 
\ No newline at end of file
+    return [summary for summary in summaries if summary is not None]
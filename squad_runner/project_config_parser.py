@@ -2,11 +2,175 @@
 Project Configuration Parser - Reads enhanced project files with agent definitions
 """
 
+import copy
+import logging
+import mmap
+import os
 import re
-import yaml
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
+# YAML loader class, resolved on first parse so importing this module skips PyYAML
+_SafeLoader = None
+
+
+def _load_yaml(stream):
+    """Safely load YAML, preferring the libyaml-backed loader when PyYAML was built with it."""
+    global _SafeLoader
+    import yaml
+    if _SafeLoader is None:
+        _SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(stream, Loader=_SafeLoader)
+
+
+# Section and list patterns, compiled once at import
+_AGENT_CFG_RE = re.compile(
+    r'AGENT_CONFIGURATION:\s*\n(.*?)(?=\n\s*WORKFLOW_CONFIGURATION:|$)',
+    re.DOTALL | re.IGNORECASE
+)
+_WORKFLOW_RE = re.compile(r'WORKFLOW_CONFIGURATION:\s*\n(.*?)$', re.DOTALL | re.IGNORECASE)
+_PROJ_DESC_HDR_RE = re.compile(r'^PROJECT_DESCRIPTION:\s*\n', re.IGNORECASE)
+# Numbered ("1. **Title** - desc") and bullet ("- **Title** - desc") requirements in one pass
+_REQUIREMENTS_RE = re.compile(
+    r'(?:^\s*\d+\.\s*\*\*(?P<num_title>.*?)\*\*\s*-\s*(?P<num_desc>.*?)$)'
+    r'|(?:^\s*[-*]\s*\*\*(?P<b_title>.*?)\*\*\s*-?\s*(?P<b_desc>.*?)$)',
+    re.MULTILINE,
+)
+_METRICS_SECTION_RE = re.compile(
+    r'(?:Success Metrics|Success Criteria):\s*\n(.*?)(?=\n\s*##|\n\s*---|\n\s*[A-Z_]+:|$)',
+    re.DOTALL | re.IGNORECASE
+)
+_BULLET_RE = re.compile(r'^\s*[-*]\s*(.*?)$', re.MULTILINE)
+
+# Project type keywords, highest priority first
+_PROJECT_TYPE_TERMS = (
+    ("restaurant", ("restaurant", "food", "dining", "kitchen", "menu")),
+    ("creative_writing", ("writing", "story", "book", "author", "publish")),
+    ("legal", ("legal", "contract", "compliance", "law")),
+    ("marketing", ("marketing", "campaign", "social media", "advertising")),
+    ("finance", ("finance", "financial", "budget", "accounting")),
+    ("web_business", ("website", "web", "sales", "b2b", "lead")),
+)
+# Keyword -> (priority, project type), matched in a single pass over the description
+_PROJECT_TYPE_BY_TERM = {
+    term: (priority, project_type)
+    for priority, (project_type, terms) in enumerate(_PROJECT_TYPE_TERMS)
+    for term in terms
+}
+_PROJECT_TYPE_RE = re.compile(
+    "|".join(re.escape(term) for term in sorted(_PROJECT_TYPE_BY_TERM, key=len, reverse=True)),
+    re.IGNORECASE
+)
+
+# Files at least this large are mapped rather than read through a text buffer
+_MMAP_THRESHOLD = 64 * 1024
+
+
+def _read_text(file_path: Path) -> str:
+    """Read a UTF-8 text file, mapping it into memory when it is large."""
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+            data = f.read()
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                data = mm[:]
+    content = data.decode('utf-8')
+    # Match the newline translation of text-mode reads
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
+# Built-in agent templates by project type; shared across calls and never mutated
+_DEFAULT_AGENTS_SOFTWARE = (
+    {
+        "role": {
+            "name": "Product Manager",
+            "description": "Requirements analysis and project coordination specialist",
+            "type": "planner",
+            "responsibilities": ["Define requirements", "Manage scope", "Coordinate team"],
+            "expertise": ["Product management", "Requirements analysis", "Project coordination"]
+        }
+    },
+    {
+        "role": {
+            "name": "Software Engineer", 
+            "description": "Code implementation and technical execution specialist",
+            "type": "builder",
+            "responsibilities": ["Implement features", "Write code", "Create technical solutions"],
+            "expertise": ["Software development", "Programming", "Technical implementation"]
+        }
+    },
+    {
+        "role": {
+            "name": "Quality Assurance",
+            "description": "Testing and quality validation specialist", 
+            "type": "tester",
+            "responsibilities": ["Test features", "Validate quality", "Find issues"],
+            "expertise": ["Quality assurance", "Testing", "Bug detection"]
+        }
+    },
+)
+_DEFAULT_AGENTS_RESTAURANT = (
+    {
+        "role": {
+            "name": "Operations Manager",
+            "description": "Restaurant operations and efficiency specialist",
+            "type": "planner",
+            "responsibilities": ["Optimize workflows", "Manage operations", "Plan strategies"],
+            "expertise": ["Restaurant operations", "Workflow optimization", "Staff management"]
+        }
+    },
+    {
+        "role": {
+            "name": "Systems Developer", 
+            "description": "Restaurant technology and system implementation specialist",
+            "type": "builder",
+            "responsibilities": ["Build systems", "Implement technology", "Create solutions"],
+            "expertise": ["Restaurant technology", "System integration", "Process automation"]
+        }
+    },
+)
+_DEFAULT_AGENTS_CREATIVE_WRITING = (
+    {
+        "role": {
+            "name": "Story Architect",
+            "description": "Plot and narrative development specialist",
+            "type": "planner", 
+            "responsibilities": ["Develop plots", "Plan narratives", "Structure stories"],
+            "expertise": ["Narrative structure", "Plot development", "Character design"]
+        }
+    },
+    {
+        "role": {
+            "name": "Content Creator",
+            "description": "Writing and prose development specialist",
+            "type": "builder",
+            "responsibilities": ["Write content", "Develop prose", "Create narratives"], 
+            "expertise": ["Creative writing", "Prose composition", "Content creation"]
+        }
+    },
+)
+_DEFAULT_AGENTS_BY_TYPE = {
+    "software_development": _DEFAULT_AGENTS_SOFTWARE,
+    "restaurant": _DEFAULT_AGENTS_RESTAURANT,
+    "creative_writing": _DEFAULT_AGENTS_CREATIVE_WRITING,
+}
+
+
+@dataclass
+class ProjectConfig:
+    """Parsed project file: description, agent definitions and workflow settings."""
+    project_description: str = ""
+    agents: List[Dict[str, Any]] = field(default_factory=list)
+    workflow: Dict[str, Any] = field(default_factory=dict)
+    requirements: List[str] = field(default_factory=list)
+    success_metrics: List[str] = field(default_factory=list)
+
 
 class ProjectConfigParser:
     """Parse enhanced project files that include agent configurations."""
@@ -16,14 +180,14 @@ class ProjectConfigParser:
         self.agent_configurations = []
         self.workflow_configuration = {}
     
-    def parse_project_file(self, file_path: str) -> Dict[str, Any]:
+    def parse_project_file(self, file_path: str) -> ProjectConfig:
         """Parse a project file with embedded agent configurations.
         
         Args:
             file_path: Path to the project file (prompt.txt or .yaml)
             
         Returns:
-            Dictionary containing project description, agent configs, and workflow settings
+            ProjectConfig with the project description, agent configs, and workflow settings
         """
         file_path = Path(file_path)
         
@@ -32,23 +196,24 @@ class ProjectConfigParser:
         else:
             return self._parse_text_file(file_path)
     
-    def _parse_yaml_file(self, file_path: Path) -> Dict[str, Any]:
+    def _parse_yaml_file(self, file_path: Path) -> ProjectConfig:
         """Parse a YAML configuration file."""
         with open(file_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+            config = _load_yaml(f)
         
-        return {
-            "project_description": config.get("project_description", ""),
-            "agents": config.get("agents", []),
-            "workflow": config.get("workflow", {}),
-            "requirements": config.get("requirements", []),
-            "success_metrics": config.get("success_metrics", [])
-        }
+        return ProjectConfig(
+            project_description=config.get("project_description", ""),
+            agents=config.get("agents", []),
+            workflow=config.get("workflow", {}),
+            requirements=config.get("requirements", []),
+            success_metrics=config.get("success_metrics", [])
+        )
     
-    def _parse_text_file(self, file_path: Path) -> Dict[str, Any]:
+    def _parse_text_file(self, file_path: Path) -> ProjectConfig:
         """Parse a text file with embedded YAML sections."""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        import yaml
+        
+        content = _read_text(file_path)
         
         # Split content into sections
         project_description, agent_config, workflow_config = self._split_content_sections(content)
@@ -57,43 +222,35 @@ class ProjectConfigParser:
         agents = []
         if agent_config:
             try:
-                parsed_config = yaml.safe_load(agent_config)
+                parsed_config = _load_yaml(agent_config)
                 agents = parsed_config.get("agents", [])
             except yaml.YAMLError as e:
-                print(f"Warning: Could not parse agent configuration: {e}")
+                logger.warning("Could not parse agent configuration: %s", e)
         
         # Parse workflow configuration  
         workflow = {}
         if workflow_config:
             try:
-                workflow = yaml.safe_load(workflow_config)
+                workflow = _load_yaml(workflow_config)
             except yaml.YAMLError as e:
-                print(f"Warning: Could not parse workflow configuration: {e}")
+                logger.warning("Could not parse workflow configuration: %s", e)
         
-        return {
-            "project_description": project_description.strip(),
-            "agents": agents,
-            "workflow": workflow,
-            "requirements": self._extract_requirements(project_description),
-            "success_metrics": self._extract_success_metrics(project_description)
-        }
+        return ProjectConfig(
+            project_description=project_description.strip(),
+            agents=agents,
+            workflow=workflow,
+            requirements=self._extract_requirements(project_description),
+            success_metrics=self._extract_success_metrics(project_description)
+        )
     
     def _split_content_sections(self, content: str) -> Tuple[str, str, str]:
         """Split content into project description, agent config, and workflow config sections."""
         
         # Look for agent configuration section
-        agent_config_match = re.search(
-            r'AGENT_CONFIGURATION:\s*\n(.*?)(?=\n\s*WORKFLOW_CONFIGURATION:|$)',
-            content,
-            re.DOTALL | re.IGNORECASE
-        )
+        agent_config_match = _AGENT_CFG_RE.search(content)
         
         # Look for workflow configuration section
-        workflow_config_match = re.search(
-            r'WORKFLOW_CONFIGURATION:\s*\n(.*?)$',
-            content,
-            re.DOTALL | re.IGNORECASE
-        )
+        workflow_config_match = _WORKFLOW_RE.search(content)
         
         # Extract sections
         agent_config = agent_config_match.group(1).strip() if agent_config_match else ""
@@ -106,50 +263,43 @@ class ProjectConfigParser:
             project_description = content.strip()
         
         # Remove "PROJECT_DESCRIPTION:" header if present
-        project_description = re.sub(r'^PROJECT_DESCRIPTION:\s*\n', '', project_description, flags=re.IGNORECASE)
+        project_description = _PROJ_DESC_HDR_RE.sub('', project_description)
         
         return project_description, agent_config, workflow_config
     
     def _extract_requirements(self, project_description: str) -> List[str]:
         """Extract requirements from project description."""
-        requirements = []
-        
-        # Look for numbered requirements
-        requirement_pattern = r'^\s*(\d+)\.\s*\*\*(.*?)\*\*\s*-\s*(.*?)$'
-        for match in re.finditer(requirement_pattern, project_description, re.MULTILINE):
-            title = match.group(2)
-            description = match.group(3)
-            requirements.append(f"{title}: {description}")
+        numbered = []
+        bullets = []
         
-        # Look for bullet point requirements
-        bullet_pattern = r'^\s*[-*]\s*\*\*(.*?)\*\*\s*-?\s*(.*?)$'
-        for match in re.finditer(bullet_pattern, project_description, re.MULTILINE):
-            title = match.group(1)
-            description = match.group(2)
+        for match in _REQUIREMENTS_RE.finditer(project_description):
+            num_title = match.group("num_title")
+            if num_title is not None:
+                numbered.append(f"{num_title}: {match.group('num_desc')}")
+                continue
+            
+            title = match.group("b_title")
+            description = match.group("b_desc")
             if description:
-                requirements.append(f"{title}: {description}")
+                bullets.append(f"{title}: {description}")
             else:
-                requirements.append(title)
+                bullets.append(title)
         
-        return requirements
+        # Numbered requirements are listed before bullet points
+        return numbered + bullets
     
     def _extract_success_metrics(self, project_description: str) -> List[str]:
         """Extract success metrics from project description."""
         metrics = []
         
         # Look for success metrics section
-        metrics_section = re.search(
-            r'(?:Success Metrics|Success Criteria):\s*\n(.*?)(?=\n\s*##|\n\s*---|\n\s*[A-Z_]+:|$)',
-            project_description,
-            re.DOTALL | re.IGNORECASE
-        )
+        metrics_section = _METRICS_SECTION_RE.search(project_description)
         
         if metrics_section:
             metrics_text = metrics_section.group(1)
             
             # Extract bullet points
-            bullet_pattern = r'^\s*[-*]\s*(.*?)$'
-            for match in re.finditer(bullet_pattern, metrics_text, re.MULTILINE):
+            for match in _BULLET_RE.finditer(metrics_text):
                 metrics.append(match.group(1).strip())
         
         return metrics
@@ -161,120 +311,46 @@ class ProjectConfigParser:
         role = agent_config.get("role", {})
         for field in required_role_fields:
             if field not in role:
-                print(f"Warning: Agent configuration missing required field: role.{field}")
+                logger.warning("Agent configuration missing required field: role.%s", field)
                 return False
         
         return True
     
-    def create_default_agents_if_missing(self, config: Dict[str, Any]) -> Dict[str, Any]:
+    def create_default_agents_if_missing(self, config: ProjectConfig) -> ProjectConfig:
         """Create default agent configuration if none specified."""
-        if not config.get("agents"):
+        if not config.agents:
             # Determine project type from description
-            project_type = self._detect_project_type(config.get("project_description", ""))
-            config["agents"] = self._get_default_agents_for_type(project_type)
+            project_type = self._detect_project_type(config.project_description)
+            config.agents = self._get_default_agents_for_type(project_type)
         
         return config
     
     def _detect_project_type(self, description: str) -> str:
         """Detect project type from description text."""
-        description_lower = description.lower()
+        # One case-insensitive scan for every keyword; the highest-priority type seen wins
+        best = None
+        for match in _PROJECT_TYPE_RE.finditer(description):
+            candidate = _PROJECT_TYPE_BY_TERM[match.group(0).lower()]
+            if best is None or candidate < best:
+                best = candidate
+                if best[0] == 0:
+                    break
         
-        if any(term in description_lower for term in ["restaurant", "food", "dining", "kitchen", "menu"]):
-            return "restaurant"
-        elif any(term in description_lower for term in ["writing", "story", "book", "author", "publish"]):
-            return "creative_writing"
-        elif any(term in description_lower for term in ["legal", "contract", "compliance", "law"]):
-            return "legal"
-        elif any(term in description_lower for term in ["marketing", "campaign", "social media", "advertising"]):
-            return "marketing"
-        elif any(term in description_lower for term in ["finance", "financial", "budget", "accounting"]):
-            return "finance"
-        elif any(term in description_lower for term in ["website", "web", "sales", "b2b", "lead"]):
-            return "web_business"
-        else:
-            return "software_development"
+        return best[1] if best else "software_development"
     
     def _get_default_agents_for_type(self, project_type: str) -> List[Dict[str, Any]]:
         """Get default agent configurations for different project types."""
-        
-        defaults = {
-            "software_development": [
-                {
-                    "role": {
-                        "name": "Product Manager",
-                        "description": "Requirements analysis and project coordination specialist",
-                        "type": "planner",
-                        "responsibilities": ["Define requirements", "Manage scope", "Coordinate team"],
-                        "expertise": ["Product management", "Requirements analysis", "Project coordination"]
-                    }
-                },
-                {
-                    "role": {
-                        "name": "Software Engineer", 
-                        "description": "Code implementation and technical execution specialist",
-                        "type": "builder",
-                        "responsibilities": ["Implement features", "Write code", "Create technical solutions"],
-                        "expertise": ["Software development", "Programming", "Technical implementation"]
-                    }
-                },
-                {
-                    "role": {
-                        "name": "Quality Assurance",
-                        "description": "Testing and quality validation specialist", 
-                        "type": "tester",
-                        "responsibilities": ["Test features", "Validate quality", "Find issues"],
-                        "expertise": ["Quality assurance", "Testing", "Bug detection"]
-                    }
-                }
-            ],
-            
-            "restaurant": [
-                {
-                    "role": {
-                        "name": "Operations Manager",
-                        "description": "Restaurant operations and efficiency specialist",
-                        "type": "planner",
-                        "responsibilities": ["Optimize workflows", "Manage operations", "Plan strategies"],
-                        "expertise": ["Restaurant operations", "Workflow optimization", "Staff management"]
-                    }
-                },
-                {
-                    "role": {
-                        "name": "Systems Developer", 
-                        "description": "Restaurant technology and system implementation specialist",
-                        "type": "builder",
-                        "responsibilities": ["Build systems", "Implement technology", "Create solutions"],
-                        "expertise": ["Restaurant technology", "System integration", "Process automation"]
-                    }
-                }
-            ],
-            
-            "creative_writing": [
-                {
-                    "role": {
-                        "name": "Story Architect",
-                        "description": "Plot and narrative development specialist",
-                        "type": "planner", 
-                        "responsibilities": ["Develop plots", "Plan narratives", "Structure stories"],
-                        "expertise": ["Narrative structure", "Plot development", "Character design"]
-                    }
-                },
-                {
-                    "role": {
-                        "name": "Content Creator",
-                        "description": "Writing and prose development specialist",
-                        "type": "builder",
-                        "responsibilities": ["Write content", "Develop prose", "Create narratives"], 
-                        "expertise": ["Creative writing", "Prose composition", "Content creation"]
-                    }
-                }
-            ]
-        }
-        
-        return defaults.get(project_type, defaults["software_development"])
+        # Deep copy so callers can't mutate the shared templates
+        return copy.deepcopy(list(_DEFAULT_AGENTS_BY_TYPE.get(project_type, _DEFAULT_AGENTS_SOFTWARE)))
+
+
+@lru_cache(maxsize=128)
+def _parse_cached(path: str, mtime_ns: int, size: int) -> ProjectConfig:
+    """Parse a project file; the stat fields key the cache so edits invalidate it."""
+    return ProjectConfigParser().parse_project_file(path)
 
 
-def parse_project_configuration(project_path: str) -> Dict[str, Any]:
+def parse_project_configuration(project_path: str) -> ProjectConfig:
     """Convenience function to parse a project configuration file.
     
     Args:
@@ -283,15 +359,16 @@ def parse_project_configuration(project_path: str) -> Dict[str, Any]:
     Returns:
         Parsed project configuration
     """
-    parser = ProjectConfigParser()
-    config = parser.parse_project_file(project_path)
-    config = parser.create_default_agents_if_missing(config)
+    st = os.stat(project_path)
+    # Copy so callers (and the default-agent fill below) never mutate the cached parse
+    config = copy.deepcopy(_parse_cached(str(project_path), st.st_mtime_ns, st.st_size))
+    config = ProjectConfigParser().create_default_agents_if_missing(config)
     
     return config
 
 
 def create_agents_from_config(
-    config: Dict[str, Any],
+    config: ProjectConfig,
     model_client,
     project_context: Dict[str, Any],
     project_manager
@@ -311,7 +388,7 @@ def create_agents_from_config(
     
     agents = []
     
-    for agent_config in config.get("agents", []):
+    for agent_config in config.agents:
         try:
             agent = create_agent(
                 agent_type="dynamic",
@@ -324,6 +401,6 @@ def create_agents_from_config(
             )
             agents.append(agent)
         except Exception as e:
-            print(f"Warning: Could not create agent from config: {e}")
+            logger.warning("Could not create agent from config: %s", e)
     
     return agents 
\ No newline at end of file
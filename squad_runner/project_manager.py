@@ -2,11 +2,119 @@
 Project management for AutoSquad - handles project lifecycle and workspace management
 """
 
+import asyncio
+import atexit
+import hashlib
 import json
+import os
+import re
 import shutil
+import stat
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, is_dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib encoder
+    orjson = None
+
+# Bound once; get_file_info calls it per file
+_fromtimestamp = datetime.fromtimestamp
+
+# Agent actions are buffered and written out in batches of this many records,
+# or by a background flusher after this many seconds, whichever comes first
+_ACTION_FLUSH_EVERY = 64
+_ACTION_FLUSH_INTERVAL = 0.25
+# Write buffer for session log files; data reaches disk on fsync at session end
+_LOG_BUFFER_SIZE = 1 << 20
+
+# Per-session conversation log: one JSON object per round, one round per line
+_CONVERSATION_LOG = "conversation.ndjson"
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize a log record or summary dataclass to indented JSON bytes."""
+    if orjson is not None:
+        # orjson encodes dataclasses natively, without building an intermediate dict
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    if is_dataclass(data):
+        data = asdict(data)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _dumps_compact(data: Any) -> bytes:
+    """Serialize a value to compact JSON bytes, stringifying values JSON can't represent."""
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def _dumps_line(data: Dict[str, Any]) -> bytes:
+    """Serialize a log record as a single JSON line."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+    return json.dumps(data).encode("utf-8") + b"\n"
+
+
+def _open_append(path: Path):
+    """Open a session log for buffered binary appends."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0), 0o644)
+    return open(fd, 'wb', buffering=_LOG_BUFFER_SIZE)
+
+
+# Start of a conversation log line for a development round; reflections log fractional rounds
+_ROUND_LINE_RE = re.compile(rb'\{"round":\s*-?\d+\s*[,}]')
+
+
+def _count_rounds(path: Path) -> int:
+    """Count the development-round lines of a conversation log without decoding it."""
+    with open(path, 'rb', buffering=_LOG_BUFFER_SIZE) as f:
+        return sum(1 for line in f if _ROUND_LINE_RE.match(line))
+
+
+def _with_timestamp(ts_ns: int, line: bytes) -> bytes:
+    """Prefix a serialized JSON object line with its ISO "timestamp" field."""
+    iso = datetime.fromtimestamp(ts_ns / 1e9).isoformat().encode("ascii")
+    separator = b'",' if orjson is not None else b'", '
+    opener = b'{"timestamp":"' if orjson is not None else b'{"timestamp": "'
+    return opener + iso + separator + line[1:]
+
+
+@dataclass
+class SessionSummary:
+    """Counts and creation time of one logging session."""
+    session_id: str
+    rounds: int
+    created: str
+    conversation_logs: int
+    workspace_snapshots: int
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the summary as a plain dictionary."""
+        return asdict(self)
+
+
+@dataclass
+class ProjectSummary:
+    """Final state of a project: prompt, workspace contents and session summary."""
+    project_path: str
+    prompt: Optional[str]
+    workspace_summary: str
+    files_created: List[str]
+    session_summary: Optional[SessionSummary]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the summary as a plain dictionary, nested summaries included."""
+        return asdict(self)
+    
+    def to_bytes(self) -> bytes:
+        """Serialize the summary to indented JSON bytes."""
+        return _dumps(self)
 
 
 class ProjectWorkspace:
@@ -15,14 +123,41 @@ class ProjectWorkspace:
     def __init__(self, workspace_path: Path):
         self.workspace_path = workspace_path
         self.workspace_path.mkdir(exist_ok=True)
+        # Bumped on every change made through this object so callers can cache derived views
+        self.generation = 0
+        # Most recent backup and its manifest, reused to hard-link unchanged files
+        self._last_backup: Optional[Tuple[Path, Dict[str, List[int]]]] = None
+    
+    def _iter_file_entries(self) -> Iterator[Tuple[str, os.DirEntry]]:
+        """Yield (relative path, directory entry) for every file in the workspace."""
+        root = str(self.workspace_path)
+        stack = [root]
+        while stack:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    # DirEntry answers these from the directory listing, without a stat per entry
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        yield os.path.relpath(entry.path, root), entry
     
     def list_files(self) -> List[str]:
         """List all files in the workspace."""
+        files = [rel_path for rel_path, _ in self._iter_file_entries()]
+        files.sort()
+        return files
+    
+    def list_files_with_stat(self) -> List[Tuple[str, int, float]]:
+        """List all files in the workspace as (path, size, mtime), sorted by path."""
         files = []
-        for file_path in self.workspace_path.rglob("*"):
-            if file_path.is_file():
-                files.append(str(file_path.relative_to(self.workspace_path)))
-        return sorted(files)
+        for rel_path, entry in self._iter_file_entries():
+            try:
+                st = entry.stat()
+            except OSError:
+                continue  # Removed since the directory was listed
+            files.append((rel_path, st.st_size, st.st_mtime))
+        files.sort()
+        return files
     
     def read_file(self, file_path: str) -> str:
         """Read a file from the workspace."""
@@ -41,38 +176,82 @@ class ProjectWorkspace:
         full_path = self.workspace_path / file_path
         full_path.parent.mkdir(parents=True, exist_ok=True)
         full_path.write_text(content, encoding='utf-8')
+        self.generation += 1
     
     def delete_file(self, file_path: str) -> None:
         """Delete a file from the workspace."""
         full_path = self.workspace_path / file_path
         if full_path.exists():
             full_path.unlink()
+            self.generation += 1
     
     def create_directory(self, dir_path: str) -> None:
         """Create a directory in the workspace."""
         full_path = self.workspace_path / dir_path
         full_path.mkdir(parents=True, exist_ok=True)
+        self.generation += 1
     
     def get_file_info(self, file_path: str) -> Dict[str, Any]:
         """Get information about a file."""
-        full_path = self.workspace_path / file_path
-        if not full_path.exists():
-            raise FileNotFoundError(f"File {file_path} not found")
+        # A single stat answers existence, size, mtime and type
+        try:
+            st = os.stat(self.workspace_path / file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File {file_path} not found") from None
         
-        stat = full_path.stat()
         return {
             "path": file_path,
-            "size": stat.st_size,
-            "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-            "is_directory": full_path.is_dir()
+            "size": st.st_size,
+            "modified": _fromtimestamp(st.st_mtime).isoformat(),
+            "is_directory": stat.S_ISDIR(st.st_mode)
         }
     
+    def _previous_backup(self, backup_dir: Path) -> Optional[Tuple[Path, Dict[str, List[int]]]]:
+        """Find the latest backup in backup_dir that has a readable manifest."""
+        if self._last_backup is not None and self._last_backup[0].parent == backup_dir:
+            return self._last_backup
+        
+        # Backup names embed a sortable timestamp, so the last manifest is the newest backup
+        for manifest_file in sorted(backup_dir.glob("workspace_backup_*.manifest.json"), reverse=True):
+            backup_path = manifest_file.with_name(manifest_file.name[:-len(".manifest.json")])
+            try:
+                return backup_path, json.loads(manifest_file.read_bytes())
+            except (OSError, ValueError):
+                continue
+        return None
+    
     def backup_workspace(self, backup_dir: Path) -> None:
-        """Create a backup of the workspace."""
+        """Create a backup of the workspace.
+        
+        Files unchanged since the previous backup (same size, mtime and inode) are
+        hard-linked to that backup's copy instead of being copied again.
+        """
         backup_dir.mkdir(parents=True, exist_ok=True)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_path = backup_dir / f"workspace_backup_{timestamp}"
-        shutil.copytree(self.workspace_path, backup_path)
+        
+        previous = self._previous_backup(backup_dir)
+        root = str(self.workspace_path)
+        manifest: Dict[str, List[int]] = {}
+        
+        def copy_or_link(src: str, dst: str) -> str:
+            rel_path = os.path.relpath(src, root)
+            st = os.stat(src)
+            signature = [st.st_size, st.st_mtime_ns, st.st_ino]
+            manifest[rel_path] = signature
+            if previous is not None and previous[1].get(rel_path) == signature:
+                try:
+                    os.link(previous[0] / rel_path, dst)
+                    return dst
+                except OSError:
+                    pass  # Previous copy gone or links unsupported; copy instead
+            return shutil.copy2(src, dst)
+        
+        shutil.copytree(self.workspace_path, backup_path, copy_function=copy_or_link)
+        
+        manifest_file = backup_dir / f"{backup_path.name}.manifest.json"
+        manifest_file.write_bytes(_dumps_compact(manifest))
+        self._last_backup = (backup_path, manifest)
 
 
 class LogManager:
@@ -82,31 +261,95 @@ class LogManager:
         self.logs_path = logs_path
         self.logs_path.mkdir(exist_ok=True)
         self.current_session = None
+        
+        # Serialized agent actions waiting to be appended to agent_actions.jsonl
+        # Held as (time.time_ns(), line without timestamp); the ISO form is built at flush
+        self._action_buf: List[Tuple[int, bytes]] = []
+        self._action_lock = threading.Lock()
+        self._action_fp = None
+        self._flusher: Optional[threading.Thread] = None
+        self._flusher_stop = threading.Event()
+        self._conversation_fp = None
+        # Rounds and reflections may be logged from different threads; keep each line whole
+        self._conversation_lock = threading.Lock()
+        self._exit_hook_registered = False
     
     def start_session(self, session_id: str) -> None:
         """Start a new logging session."""
+        self.end_session()
         self.current_session = session_id
         session_dir = self.logs_path / session_id
         session_dir.mkdir(exist_ok=True)
+        
+        self._action_fp = _open_append(session_dir / "agent_actions.jsonl")
+        self._conversation_fp = _open_append(session_dir / _CONVERSATION_LOG)
+        if not self._exit_hook_registered:
+            atexit.register(self.flush)
+            self._exit_hook_registered = True
+        
+        self._flusher_stop = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._run_flusher,
+            args=(self._flusher_stop,),
+            name="autosquad-log-flusher",
+            daemon=True
+        )
+        self._flusher.start()
+    
+    def _run_flusher(self, stop: threading.Event) -> None:
+        """Write buffered session logs out periodically until the session ends."""
+        while not stop.wait(_ACTION_FLUSH_INTERVAL):
+            self.flush()
     
-    def log_conversation(self, round_num: int, messages: List[Dict[str, Any]]) -> None:
-        """Log conversation messages for a round."""
+    def flush(self, sync: bool = False) -> None:
+        """Write buffered session logs out to their files, fsyncing them if sync is set."""
+        with self._action_lock:
+            if self._action_fp is None:
+                self._action_buf.clear()
+                return
+            if self._action_buf:
+                self._action_fp.write(b''.join(_with_timestamp(ts_ns, line) for ts_ns, line in self._action_buf))
+                self._action_buf.clear()
+            for fp in (self._action_fp, self._conversation_fp):
+                fp.flush()
+                if sync:
+                    os.fsync(fp.fileno())
+    
+    def end_session(self) -> None:
+        """Flush, sync and close the current session's logs."""
+        if self._flusher is not None:
+            self._flusher_stop.set()
+            self._flusher.join()
+            self._flusher = None
+        self.flush(sync=True)
+        with self._action_lock:
+            self.current_session = None
+            if self._action_fp is not None:
+                self._action_fp.close()
+                self._conversation_fp.close()
+                self._action_fp = None
+                self._conversation_fp = None
+    
+    def log_conversation(self, round_num: int, messages: List[Dict[str, Any]], ts: Optional[str] = None) -> None:
+        """Log conversation messages for a round, stamped with ts (ISO format) if given."""
         if not self.current_session:
             raise RuntimeError("No active logging session")
         
-        log_file = self.logs_path / self.current_session / f"round_{round_num:02d}_conversation.json"
-        
-        log_data = {
-            "round": round_num,
-            "timestamp": datetime.now().isoformat(),
-            "messages": messages
-        }
-        
-        with open(log_file, 'w') as f:
-            json.dump(log_data, f, indent=2)
+        # Encode the whole line before writing so a serialization error can't leave
+        # a partial line for the next round to be appended onto
+        header = _dumps_compact({"round": round_num, "timestamp": ts or datetime.now().isoformat()})
+        line = b"".join((
+            header[:-1], b',"messages":[',
+            b",".join(_dumps_compact(message) for message in messages),
+            b"]}\n"
+        ))
+        with self._conversation_lock:
+            self._conversation_fp.write(line)
+            # Rounds are infrequent; don't let one sit in the write buffer until exit
+            self._conversation_fp.flush()
     
-    def log_workspace_state(self, round_num: int, workspace_files: List[str]) -> None:
-        """Log the workspace state after a round."""
+    def log_workspace_state(self, round_num: int, workspace_files: List[str], ts: Optional[str] = None) -> None:
+        """Log the workspace state after a round, stamped with ts (ISO format) if given."""
         if not self.current_session:
             raise RuntimeError("No active logging session")
         
@@ -114,47 +357,66 @@ class LogManager:
         
         log_data = {
             "round": round_num,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": ts or datetime.now().isoformat(),
             "files": workspace_files
         }
         
-        with open(log_file, 'w') as f:
-            json.dump(log_data, f, indent=2)
+        with open(log_file, 'wb') as f:
+            f.write(_dumps(log_data))
+    
+    def write_session_file(self, filename: str, data: bytes) -> str:
+        """Write data to a file in the current session directory and return its path relative to the logs."""
+        if not self.current_session:
+            raise RuntimeError("No active logging session")
+        
+        rel_path = f"{self.current_session}/{filename}"
+        (self.logs_path / rel_path).write_bytes(data)
+        return rel_path
     
     def log_agent_action(self, agent_name: str, action: str, details: Dict[str, Any]) -> None:
         """Log an individual agent action."""
         if not self.current_session:
             return  # Silently skip if no session
         
-        log_file = self.logs_path / self.current_session / "agent_actions.jsonl"
-        
         log_entry = {
-            "timestamp": datetime.now().isoformat(),
             "agent": agent_name,
             "action": action,
             "details": details
         }
         
-        with open(log_file, 'a') as f:
-            f.write(json.dumps(log_entry) + '\n')
+        # Serialize now so later changes to details are not logged; timestamp at flush
+        line = _dumps_line(log_entry)
+        with self._action_lock:
+            self._action_buf.append((time.time_ns(), line))
+            pending = len(self._action_buf)
+        if pending >= _ACTION_FLUSH_EVERY:
+            self.flush()
     
-    def get_session_summary(self, session_id: str) -> Dict[str, Any]:
+    def get_session_summary(self, session_id: str) -> SessionSummary:
         """Get a summary of a logging session."""
         session_dir = self.logs_path / session_id
         if not session_dir.exists():
             raise FileNotFoundError(f"Session {session_id} not found")
         
-        # Count files and get basic stats
-        conversation_files = list(session_dir.glob("*_conversation.json"))
+        if session_id == self.current_session:
+            self.flush()
+        
+        # One conversation line per round, plus one per reflection that isn't counted;
+        # sessions from older versions kept one file per round
+        conversation_log = session_dir / _CONVERSATION_LOG
+        if conversation_log.exists():
+            rounds = _count_rounds(conversation_log)
+        else:
+            rounds = sum(1 for _ in session_dir.glob("*_conversation.json"))
         workspace_files = list(session_dir.glob("*_workspace.json"))
         
-        return {
-            "session_id": session_id,
-            "rounds": len(conversation_files),
-            "created": datetime.fromtimestamp(session_dir.stat().st_ctime).isoformat(),
-            "conversation_logs": len(conversation_files),
-            "workspace_snapshots": len(workspace_files)
-        }
+        return SessionSummary(
+            session_id=session_id,
+            rounds=rounds,
+            created=datetime.fromtimestamp(session_dir.stat().st_ctime).isoformat(),
+            conversation_logs=rounds,
+            workspace_snapshots=len(workspace_files)
+        )
 
 
 class ProjectManager:
@@ -182,16 +444,21 @@ class ProjectManager:
         session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.logs.start_session(session_id)
         
-        # Log project initialization
-        self.logs.log_agent_action(
-            "ProjectManager",
-            "project_initialized",
-            {
-                "project_path": str(self.project_path),
-                "prompt": self.project_prompt,
-                "workspace_files": self.workspace.list_files()
-            }
-        )
+        # Log project initialization; a non-empty file list goes to its own file
+        # so the action log stays small on re-runs over large workspaces
+        details = {
+            "project_path": str(self.project_path),
+            "prompt": self.project_prompt,
+        }
+        workspace_files = self.workspace.list_files()
+        if workspace_files:
+            encoded = _dumps_compact(workspace_files)
+            details["workspace_files_path"] = self.logs.write_session_file("workspace_state_init.json", encoded)
+            details["workspace_file_count"] = len(workspace_files)
+            details["workspace_files_sha1"] = hashlib.sha1(encoded).hexdigest()
+        else:
+            details["workspace_files"] = []
+        self.logs.log_agent_action("ProjectManager", "project_initialized", details)
     
     def get_project_context(self) -> Dict[str, Any]:
         """Get the current project context for agents."""
@@ -204,64 +471,67 @@ class ProjectManager:
     
     def get_workspace_summary(self) -> str:
         """Get a human-readable summary of the workspace."""
-        files = self.workspace.list_files()
+        files = self.workspace.list_files_with_stat()
         if not files:
             return "Workspace is empty."
         
-        summary = f"Workspace contains {len(files)} files:\n"
-        for file_path in files:
-            try:
-                info = self.workspace.get_file_info(file_path)
-                summary += f"  - {file_path} ({info['size']} bytes)\n"
-            except Exception:
-                summary += f"  - {file_path}\n"
-        
-        return summary
+        lines = [f"Workspace contains {len(files)} files:"]
+        lines.extend(f"  - {file_path} ({size} bytes)" for file_path, size, _ in files)
+        lines.append("")  # Keep the trailing newline
+        return "\n".join(lines)
     
     async def save_round_state(self, round_num: int, conversation_messages: List[Dict[str, Any]]) -> None:
         """Save the state after a development round."""
-        # Log conversation
-        self.logs.log_conversation(round_num, conversation_messages)
-        
-        # Log workspace state
-        self.logs.log_workspace_state(round_num, self.workspace.list_files())
-        
-        # Create workspace backup
+        loop = asyncio.get_running_loop()
+        workspace_files = self.workspace.list_files()
         backup_dir = self.project_path / "backups"
-        self.workspace.backup_workspace(backup_dir)
+        ts = datetime.now().isoformat()
+        
+        # The conversation log, workspace log and backup touch separate files, so overlap them
+        await asyncio.gather(
+            loop.run_in_executor(None, self.logs.log_conversation, round_num, conversation_messages, ts),
+            loop.run_in_executor(None, self.logs.log_workspace_state, round_num, workspace_files, ts),
+            loop.run_in_executor(None, self.workspace.backup_workspace, backup_dir),
+        )
     
-    def create_project_summary(self) -> Dict[str, Any]:
+    def create_project_summary(self) -> ProjectSummary:
         """Create a final project summary."""
-        return {
-            "project_path": str(self.project_path),
-            "prompt": self.project_prompt,
-            "workspace_summary": self.get_workspace_summary(),
-            "files_created": self.workspace.list_files(),
-            "session_summary": self.logs.get_session_summary(self.logs.current_session) if self.logs.current_session else None
-        }
+        return ProjectSummary(
+            project_path=str(self.project_path),
+            prompt=self.project_prompt,
+            workspace_summary=self.get_workspace_summary(),
+            files_created=self.workspace.list_files(),
+            session_summary=self.logs.get_session_summary(self.logs.current_session) if self.logs.current_session else None
+        )
     
     def export_project(self, export_path: Path) -> None:
         """Export the project to a new location."""
         export_path.mkdir(parents=True, exist_ok=True)
         
-        # Copy workspace
-        shutil.copytree(
-            self.workspace.workspace_path,
-            export_path / "workspace",
-            dirs_exist_ok=True
-        )
-        
-        # Copy prompt
-        shutil.copy2(self.prompt_file, export_path / "prompt.txt")
+        # Make sure buffered agent actions are part of the exported logs
+        self.logs.flush()
         
-        # Copy logs
-        shutil.copytree(
-            self.logs.logs_path,
-            export_path / "logs",
-            dirs_exist_ok=True
-        )
+        # Workspace, prompt and logs are independent copies, so run them side by side
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            copies = [
+                executor.submit(
+                    shutil.copytree,
+                    self.workspace.workspace_path,
+                    export_path / "workspace",
+                    dirs_exist_ok=True
+                ),
+                executor.submit(shutil.copy2, self.prompt_file, export_path / "prompt.txt"),
+                executor.submit(
+                    shutil.copytree,
+                    self.logs.logs_path,
+                    export_path / "logs",
+                    dirs_exist_ok=True
+                ),
+            ]
+            for copy in copies:
+                copy.result()
         
         # Create summary
         summary = self.create_project_summary()
-        with open(export_path / "project_summary.json", 'w') as f:
-            json.dump(summary, f, indent=2) 
\ No newline at end of file
+        with open(export_path / "project_summary.json", 'wb') as f:
+            f.write(summary.to_bytes()) 
\ No newline at end of file
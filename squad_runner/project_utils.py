@@ -3,8 +3,12 @@ Project management utilities for AutoSquad CLI.
 """
 
 import json
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -13,19 +17,56 @@ from rich.table import Table
 from rich.panel import Panel
 from rich.tree import Tree
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib encoder
+    orjson = None
+
 console = Console()
 
 
+@dataclass(frozen=True)
+class ProjectSnapshot:
+    """File counts and sizes gathered in one walk over a project directory."""
+    workspace_file_count: int
+    log_file_count: int
+    total_size: int
+    last_modified: Optional[datetime]
+
+
+def _has_entries(directory: Path) -> bool:
+    """Check if a directory exists and is non-empty, reading at most one entry."""
+    try:
+        with os.scandir(directory) as it:
+            return next(it, None) is not None
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
+
 class ProjectInfo:
     """Information about an AutoSquad project."""
     
-    def __init__(self, project_path: Path):
+    def __init__(self, project_path: Path, prompt_mtime: Optional[float] = None):
         self.path = project_path
         self.name = project_path.name
         self.prompt_file = project_path / "prompt.txt"
         self.workspace_dir = project_path / "workspace"
         self.logs_dir = project_path / "logs"
         self.metadata_file = project_path / ".autosquad_metadata.json"
+        # prompt.txt mtime when the caller already stat'ed it (see find_projects)
+        self._prompt_mtime = prompt_mtime
+        # (prompt.txt st_mtime_ns, stripped text) from the last read
+        self._prompt_cache: Optional[Tuple[int, str]] = None
+    
+    # Filesystem-derived attributes, computed on first use and dropped by invalidate()
+    _CACHED_ATTRS = ("_fs_snapshot", "last_modified")
+    
+    def invalidate(self) -> None:
+        """Forget cached filesystem state so the next access rescans the project."""
+        for attr in self._CACHED_ATTRS:
+            self.__dict__.pop(attr, None)
+        self._prompt_mtime = None
+        self._prompt_cache = None
     
     @property
     def exists(self) -> bool:
@@ -34,67 +75,127 @@ class ProjectInfo:
     
     @property
     def prompt(self) -> str:
-        """Get the project prompt."""
-        if self.prompt_file.exists():
-            return self.prompt_file.read_text(encoding='utf-8').strip()
-        return ""
+        """Get the project prompt, re-reading prompt.txt only when its mtime changes."""
+        try:
+            mtime_ns = self.prompt_file.stat().st_mtime_ns
+        except OSError:
+            return ""
+        if self._prompt_cache is None or self._prompt_cache[0] != mtime_ns:
+            self._prompt_cache = (mtime_ns, self.prompt_file.read_text(encoding='utf-8').strip())
+        return self._prompt_cache[1]
+    
+    def prompt_preview(self, n: int = 100) -> str:
+        """Get the first n characters of the prompt, with "..." appended when it is longer.
+        
+        Only the head of prompt.txt is read unless the full prompt is already cached.
+        """
+        try:
+            mtime_ns = self.prompt_file.stat().st_mtime_ns
+        except OSError:
+            return ""
+        
+        if self._prompt_cache is not None and self._prompt_cache[0] == mtime_ns:
+            text = self._prompt_cache[1]
+        else:
+            # Up to 4 bytes per UTF-8 character, plus slack for leading whitespace
+            limit = 4 * (n + 1) + 256
+            with open(self.prompt_file, 'rb') as f:
+                head = f.read(limit + 1)
+            if len(head) <= limit:
+                text = self.prompt  # Short file: read it whole and cache it
+            else:
+                text = head[:limit].decode('utf-8', errors='ignore')
+                text = text.replace('\r\n', '\n').replace('\r', '\n').lstrip()
+                if not text[n:].strip():
+                    text = self.prompt  # Head is mostly whitespace; fall back to the full prompt
+        
+        return text[:n] + ("..." if len(text) > n else "")
     
     @property
     def has_workspace(self) -> bool:
         """Check if workspace directory exists and has files."""
-        return self.workspace_dir.exists() and any(self.workspace_dir.iterdir())
+        return _has_entries(self.workspace_dir)
     
     @property
     def has_logs(self) -> bool:
         """Check if logs directory exists and has files."""
-        return self.logs_dir.exists() and any(self.logs_dir.iterdir())
+        return _has_entries(self.logs_dir)
+    
+    def snapshot(self) -> ProjectSnapshot:
+        """File counts, total size and modification time, from one cached walk of the project."""
+        return self._fs_snapshot
+    
+    @cached_property
+    def _fs_snapshot(self) -> ProjectSnapshot:
+        """Walk the project once, collecting file counts, total size and modification time."""
+        counts = {self.workspace_dir.name: 0, self.logs_dir.name: 0}
+        total_size = 0
+        
+        # (directory, top-level entry it belongs to); top-level entries are their own group
+        stack = [(str(self.path), None)]
+        while stack:
+            directory, group = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except OSError:
+                continue  # Skip directories that can't be accessed
+            
+            for entry in entries:
+                entry_group = group if group is not None else entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, entry_group))
+                    elif entry.is_file():
+                        total_size += entry.stat().st_size
+                        if entry_group in counts:
+                            counts[entry_group] += 1
+                except OSError:
+                    pass  # Skip files that can't be accessed
+        
+        return ProjectSnapshot(
+            workspace_file_count=counts[self.workspace_dir.name],
+            log_file_count=counts[self.logs_dir.name],
+            total_size=total_size,
+            last_modified=self.last_modified,
+        )
     
     @property
     def workspace_file_count(self) -> int:
         """Count files in workspace."""
-        if not self.workspace_dir.exists():
-            return 0
-        return len([f for f in self.workspace_dir.rglob("*") if f.is_file()])
+        return self.snapshot().workspace_file_count
     
     @property
     def log_file_count(self) -> int:
         """Count files in logs."""
-        if not self.logs_dir.exists():
-            return 0
-        return len([f for f in self.logs_dir.rglob("*") if f.is_file()])
+        return self.snapshot().log_file_count
     
-    @property
+    @cached_property
     def last_modified(self) -> Optional[datetime]:
         """Get last modification time of the project."""
-        if not self.path.exists():
-            return None
-        
-        latest_time = None
-        for file_path in [self.prompt_file, self.workspace_dir, self.logs_dir]:
-            if file_path.exists():
-                file_time = datetime.fromtimestamp(file_path.stat().st_mtime)
-                if latest_time is None or file_time > latest_time:
-                    latest_time = file_time
+        mtimes = [] if self._prompt_mtime is None else [self._prompt_mtime]
+        candidates = [self.workspace_dir, self.logs_dir]
+        if self._prompt_mtime is None:
+            candidates.append(self.prompt_file)
+        for file_path in candidates:
+            try:
+                mtimes.append(file_path.stat().st_mtime)
+            except OSError:
+                pass  # Not created yet
         
-        return latest_time
+        return datetime.fromtimestamp(max(mtimes)) if mtimes else None
     
     @property
     def total_size(self) -> int:
         """Get total size of project in bytes."""
-        total = 0
-        if self.path.exists():
-            for file_path in self.path.rglob("*"):
-                if file_path.is_file():
-                    try:
-                        total += file_path.stat().st_size
-                    except (OSError, FileNotFoundError):
-                        pass  # Skip files that can't be accessed
-        return total
+        return self.snapshot().total_size
     
     def get_metadata(self) -> Dict:
         """Get project metadata from .autosquad_metadata.json if it exists."""
         if self.metadata_file.exists():
             try:
+                if orjson is not None:
+                    return orjson.loads(self.metadata_file.read_bytes())
                 return json.loads(self.metadata_file.read_text(encoding='utf-8'))
             except (json.JSONDecodeError, UnicodeDecodeError):
                 return {}
@@ -103,14 +204,23 @@ class ProjectInfo:
     def save_metadata(self, metadata: Dict) -> None:
         """Save project metadata to .autosquad_metadata.json."""
         try:
-            self.metadata_file.write_text(
-                json.dumps(metadata, indent=2, default=str),
-                encoding='utf-8'
-            )
+            if orjson is not None:
+                self.metadata_file.write_bytes(
+                    orjson.dumps(metadata, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+                )
+            else:
+                self.metadata_file.write_text(
+                    json.dumps(metadata, indent=2, default=str),
+                    encoding='utf-8'
+                )
         except Exception as e:
             console.print(f"[yellow]Warning: Could not save metadata: {e}[/yellow]")
 
 
+# Threads used to probe candidate project directories in find_projects
+_PROBE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
 def find_projects(base_dir: Path = None) -> List[ProjectInfo]:
     """Find all AutoSquad projects in the given directory (or projects/ by default)."""
     if base_dir is None:
@@ -119,12 +229,24 @@ def find_projects(base_dir: Path = None) -> List[ProjectInfo]:
     if not base_dir.exists():
         return []
     
-    projects = []
-    for item in base_dir.iterdir():
-        if item.is_dir():
-            project = ProjectInfo(item)
-            if project.exists:
-                projects.append(project)
+    with os.scandir(base_dir) as it:
+        candidates = [entry.name for entry in it if entry.is_dir()]
+    
+    def probe(name: str) -> Optional[ProjectInfo]:
+        # One stat both confirms the project and seeds its last_modified
+        try:
+            prompt_stat = os.stat(os.path.join(base_dir, name, "prompt.txt"))
+        except OSError:
+            return None
+        return ProjectInfo(base_dir / name, prompt_mtime=prompt_stat.st_mtime)
+    
+    # Probes are independent stats, so overlap them (a large win on network filesystems)
+    if len(candidates) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(candidates), _PROBE_WORKERS)) as executor:
+            probed = list(executor.map(probe, candidates))
+    else:
+        probed = [probe(name) for name in candidates]
+    projects = [project for project in probed if project is not None]
     
     return sorted(projects, key=lambda p: p.last_modified or datetime.min, reverse=True)
 
@@ -143,34 +265,34 @@ def display_project_status(project: ProjectInfo) -> None:
     
     # Get metadata
     metadata = project.get_metadata()
+    snapshot = project.snapshot()
     
     # Create status content
     status_lines = [
         f"📁 [bold]Project:[/bold] {project.name}",
         f"📍 [bold]Location:[/bold] {project.path}",
-        f"📝 [bold]Prompt:[/bold] {project.prompt[:100]}{'...' if len(project.prompt) > 100 else ''}",
+        f"📝 [bold]Prompt:[/bold] {project.prompt_preview(100)}",
         ""
     ]
     
     # Workspace info
     if project.has_workspace:
         status_lines.extend([
-            f"💼 [bold]Workspace:[/bold] ✅ {project.workspace_file_count} files",
+            f"💼 [bold]Workspace:[/bold] ✅ {snapshot.workspace_file_count} files",
         ])
     else:
         status_lines.append("💼 [bold]Workspace:[/bold] ❌ No files generated")
     
     # Logs info
     if project.has_logs:
-        status_lines.append(f"📋 [bold]Logs:[/bold] ✅ {project.log_file_count} files")
+        status_lines.append(f"📋 [bold]Logs:[/bold] ✅ {snapshot.log_file_count} files")
     else:
         status_lines.append("📋 [bold]Logs:[/bold] ❌ No logs")
     
     # Size and dates
-    size_mb = project.total_size / (1024 * 1024)
     status_lines.extend([
-        f"💾 [bold]Total Size:[/bold] {size_mb:.1f} MB",
-        f"🕒 [bold]Last Modified:[/bold] {project.last_modified.strftime('%Y-%m-%d %H:%M:%S') if project.last_modified else 'Unknown'}"
+        f"💾 [bold]Total Size:[/bold] {format_size(snapshot.total_size)}",
+        f"🕒 [bold]Last Modified:[/bold] {snapshot.last_modified.strftime('%Y-%m-%d %H:%M:%S') if snapshot.last_modified else 'Unknown'}"
     ])
     
     # Metadata info
@@ -207,6 +329,8 @@ def display_project_list(projects: List[ProjectInfo]) -> None:
     table.add_column("Last Modified", style="dim")
     
     for project in projects:
+        snapshot = project.snapshot()
+        
         # Status indicators
         status_parts = []
         if project.has_workspace:
@@ -216,21 +340,17 @@ def display_project_list(projects: List[ProjectInfo]) -> None:
         status = " ".join(status_parts) if status_parts else "📝"
         
         # File count
-        total_files = project.workspace_file_count + project.log_file_count
+        total_files = snapshot.workspace_file_count + snapshot.log_file_count
         files_text = str(total_files) if total_files > 0 else "-"
         
-        # Size
-        size_mb = project.total_size / (1024 * 1024)
-        size_text = f"{size_mb:.1f}MB" if size_mb > 0.1 else f"{project.total_size}B"
-        
         # Last modified
-        last_mod = project.last_modified.strftime('%Y-%m-%d %H:%M') if project.last_modified else "-"
+        last_mod = snapshot.last_modified.strftime('%Y-%m-%d %H:%M') if snapshot.last_modified else "-"
         
         table.add_row(
             project.name,
             status,
             files_text,
-            size_text,
+            format_size(snapshot.total_size),
             last_mod
         )
     
@@ -238,6 +358,28 @@ def display_project_list(projects: List[ProjectInfo]) -> None:
     console.print(f"\n[dim]Found {len(projects)} projects. Legend: 💼=Workspace 📋=Logs 📝=Prompt only[/dim]")
 
 
+# Most files listed under one branch of the project tree
+_TREE_FILE_LIMIT = 500
+
+
+def _add_file_branch(branch: Tree, root: Path) -> None:
+    """Add every file under root to branch as a relative path, in sorted walk order."""
+    shown = 0
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()  # Visit subdirectories in a stable order
+        rel_dir = os.path.relpath(dirpath, root)
+        for filename in sorted(filenames):
+            if shown == _TREE_FILE_LIMIT:
+                branch.add(f"[dim]... more than {_TREE_FILE_LIMIT} files, not all shown[/dim]")
+                return
+            rel_path = filename if rel_dir == "." else os.path.join(rel_dir, filename)
+            branch.add(f"📄 {rel_path}")
+            shown += 1
+    
+    if not shown:
+        branch.add("[dim]empty[/dim]")
+
+
 def display_project_tree(project: ProjectInfo) -> None:
     """Display a tree view of project contents."""
     if not project.exists:
@@ -247,34 +389,17 @@ def display_project_tree(project: ProjectInfo) -> None:
     tree = Tree(f"📁 [bold blue]{project.name}[/bold blue]")
     
     # Add prompt info
-    prompt_text = project.prompt[:50] + "..." if len(project.prompt) > 50 else project.prompt
-    tree.add(f"📝 prompt.txt - [dim]{prompt_text}[/dim]")
+    tree.add(f"📝 prompt.txt - [dim]{project.prompt_preview(50)}[/dim]")
     
     # Add workspace
     if project.workspace_dir.exists():
-        workspace_branch = tree.add("💼 workspace/")
-        workspace_files = list(project.workspace_dir.rglob("*"))
-        if workspace_files:
-            for file_path in sorted(workspace_files):
-                if file_path.is_file():
-                    rel_path = file_path.relative_to(project.workspace_dir)
-                    workspace_branch.add(f"📄 {rel_path}")
-        else:
-            workspace_branch.add("[dim]empty[/dim]")
+        _add_file_branch(tree.add("💼 workspace/"), project.workspace_dir)
     else:
         tree.add("💼 workspace/ [dim](not created)[/dim]")
     
     # Add logs
     if project.logs_dir.exists():
-        logs_branch = tree.add("📋 logs/")
-        log_files = list(project.logs_dir.rglob("*"))
-        if log_files:
-            for file_path in sorted(log_files):
-                if file_path.is_file():
-                    rel_path = file_path.relative_to(project.logs_dir)
-                    logs_branch.add(f"📄 {rel_path}")
-        else:
-            logs_branch.add("[dim]empty[/dim]")
+        _add_file_branch(tree.add("📋 logs/"), project.logs_dir)
     else:
         tree.add("📋 logs/ [dim](not created)[/dim]")
     
@@ -331,6 +456,8 @@ def clean_project(project: ProjectInfo, confirm: bool = True) -> bool:
             shutil.rmtree(project.logs_dir)
             cleaned_items.append("logs")
         
+        project.invalidate()
+        
         console.print(Panel.fit(
             f"✅ [bold green]Project cleaned successfully![/bold green]\n"
             f"Removed: {', '.join(cleaned_items)}\n"
@@ -2,82 +2,360 @@
 Token optimization utilities for AutoSquad - minimize OpenAI API token usage
 """
 
-import tiktoken
-from typing import List, Dict, Any, Optional, Tuple
-from datetime import datetime
+import hashlib
 import json
+import os
+import re
+import time
+from collections import deque
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import tiktoken
+
+# Encoders shared by every TokenOptimizer in the process, keyed by resolved model name
+_ENCODERS: Dict[str, "tiktoken.Encoding"] = {}
+
+# Keyword scanners for create_conversation_summary; each is one case-insensitive pass over the content
+_FILE_RE = re.compile(r"write_file|(?i:created file)")
+_ACTION_RE = re.compile(r"implemented|decided|chosen|completed", re.IGNORECASE)
+_TASK_RE = re.compile(r"task|feature|bug|issue", re.IGNORECASE)
+
+
+# Per-1K-token pricing for different models (as of late 2024), most specific name first
+_GPT4_RATES = {"input": 0.03, "output": 0.06}
+_MODEL_PRICING = (
+    ("gpt-4o-mini", {"input": 0.00015, "output": 0.0006}),  # Very cheap!
+    ("gpt-4o", {"input": 0.005, "output": 0.015}),
+    ("gpt-4-turbo", {"input": 0.01, "output": 0.03}),
+    ("gpt-4", _GPT4_RATES),
+    ("gpt-3.5", {"input": 0.0015, "output": 0.002}),
+)
+
+# Deterministic filler removal for system prompts; AUTOSQUAD_CAVEMAN=0 turns it off
+_CAVEMAN_ENABLED = os.getenv("AUTOSQUAD_CAVEMAN", "1") != "0"
+_CAVEMAN_RULES = (
+    (re.compile(r"\b(?:please|could you|kindly)\s+", re.IGNORECASE), ""),
+    (re.compile(r"\bI would like(?: you)?(?: to)?\s+", re.IGNORECASE), ""),
+    (re.compile(r"\b(?:it seems like|it appears that|I think that)\s+", re.IGNORECASE), ""),
+    (re.compile(r"\bprovide a detailed\b", re.IGNORECASE), "provide"),
+    (re.compile(r"\s*\b(?:thanks|thank you)(?: (?:so|very) much)?(?: in advance)?[.!]*\s*\Z", re.IGNORECASE), ""),
+    (re.compile(r"(?<=\S)[ \t]{2,}(?=\S)"), " "),  # Runs of spaces inside a line, not indentation
+)
+# Fenced code blocks are passed through untouched; their spacing and wording are significant
+_CODE_FENCE_RE = re.compile(r"(```.*?```)", re.DOTALL)
+
+
+@lru_cache(maxsize=256)
+def caveman_compress(text: str) -> str:
+    """Strip politeness and hedging filler from a prompt without changing its directives.
+    
+    Meant for static system text only; user-provided content should not go through it.
+    """
+    if not _CAVEMAN_ENABLED:
+        return text
+    parts = _CODE_FENCE_RE.split(text)
+    for index in range(0, len(parts), 2):  # Odd indices are the captured code blocks
+        for pattern, replacement in _CAVEMAN_RULES:
+            parts[index] = pattern.sub(replacement, parts[index])
+    return "".join(parts)
+
+
+def _model_rates(model: str) -> Dict[str, float]:
+    """Pricing for a model, defaulting to GPT-4 pricing for unknown models."""
+    model_key = model.lower()
+    for name, rates in _MODEL_PRICING:
+        if name in model_key:
+            return rates
+    return _GPT4_RATES
+
+
+def _get_encoder(model: str) -> "tiktoken.Encoding":
+    """Return the process-wide encoder for a model, loading its vocabulary once."""
+    key = model.replace("gpt-4", "gpt-4-0613")  # Handle model variants
+    encoder = _ENCODERS.get(key)
+    if encoder is None:
+        _ENCODERS[key] = encoder = tiktoken.encoding_for_model(key)
+    return encoder
+
+
+@lru_cache(maxsize=8192)
+def _encode_len(encoding_name: str, text: str) -> int:
+    """Token length of text, memoized across optimizers sharing an encoding."""
+    return len(tiktoken.get_encoding(encoding_name).encode(text))
+
+
+def _message_field(message: Any, field: str, default: Any = None) -> Any:
+    """Read a field from a dict message or an attribute-based message record."""
+    if isinstance(message, dict):
+        return message.get(field, default)
+    return getattr(message, field, default)
+
+
+def _with_content(message: Any, content: str) -> Any:
+    """Copy of a dict or record message with its content replaced."""
+    if isinstance(message, dict):
+        return {**message, "content": content}
+    return message._replace(content=content)
+
+
+def _text(value: Any) -> str:
+    """Message field as text, treating a missing value as empty."""
+    return "" if value is None else str(value)
+
+
+def _read_dict_message(message: Dict[str, Any]) -> Tuple[Any, Any, str]:
+    """Read (role, name, content) from an OpenAI-style chat dict."""
+    return message.get("role"), message.get("name"), _text(message.get("content"))
+
+
+def _read_content_only_message(message: Any) -> Tuple[Any, Any, str]:
+    """Read (role, name, content) from a record that only carries content."""
+    return None, None, _text(message.content)
+
+
+def _read_any_message(message: Any) -> Tuple[Any, Any, str]:
+    """Read (role, name, content) from any attribute-based message."""
+    return getattr(message, "role", None), getattr(message, "name", None), _text(getattr(message, "content", None))
+
+
+@lru_cache(maxsize=None)
+def _message_reader(message_type: type) -> Callable[[Any], Tuple[Any, Any, str]]:
+    """Pick the (role, name, content) reader specialized for a message type.
+    
+    Chat dicts and record types that only declare content (like the orchestrator's
+    round messages) skip the per-field lookups of the generic reader.
+    """
+    if issubclass(message_type, dict):
+        return _read_dict_message
+    declared = getattr(message_type, "_fields", None)
+    if declared is not None and "content" in declared and "role" not in declared and "name" not in declared:
+        return _read_content_only_message
+    return _read_any_message
 
 
 class TokenOptimizer:
     """Manages conversation context and token usage to minimize API costs."""
     
-    def __init__(self, model: str = "gpt-4", max_context_tokens: int = 6000):
+    def __init__(self, model: str = "gpt-4", max_context_tokens: int = 6000,
+                 history_window: Optional[int] = 400):
         self.model = model
         self.max_context_tokens = max_context_tokens
-        self.encoding = tiktoken.encoding_for_model(model.replace("gpt-4", "gpt-4-0613"))  # Handle model variants
+        self.history_window = history_window  # Messages a repeat can refer back to; None is unbounded
+        self.encoding = _get_encoder(model)
         self.conversation_memory = []
+        self.rates = _model_rates(model)
         self.total_tokens_used = 0
+        self.total_input_tokens = 0
+        self.total_output_tokens = 0
         self.api_calls_made = 0
+        self._usage_listeners: List[Callable[[], None]] = []
+        self._summary_dirty = True
+        self._cached_summary: Optional[Dict[str, Any]] = None
+        # Digests of originals still inside the history window, plus one slot per message
+        # passed to collapse_repeated_messages (None when it isn't an original) to age them out
+        self._seen_hashes: Set[bytes] = set()
+        self._seen_order: deque = deque()
+        self._message_token_cache: Dict[Tuple[Any, Any, str], int] = {}
+        self._system_tokens_cache: Optional[Tuple[str, int]] = None
+        
+    def add_usage_listener(self, listener: Callable[[], None]) -> None:
+        """Register a callback invoked whenever tracked token usage changes."""
+        self._usage_listeners.append(listener)
         
     def count_tokens(self, text: str) -> int:
         """Count tokens in a text string."""
-        return len(self.encoding.encode(text))
+        return _encode_len(self.encoding.name, text)
     
     def count_message_tokens(self, message: Dict[str, Any]) -> int:
         """Count tokens in a message object."""
+        # Messages are re-counted every turn, so remember counts by their token-bearing fields
+        key = self._message_key(message)
+        tokens = self._message_token_cache.get(key)
+        if tokens is not None:
+            return tokens
+        
         # Basic token counting for message structure
         tokens = 4  # Base tokens for message structure
         
-        if "content" in message:
-            tokens += self.count_tokens(str(message["content"]))
-        if "role" in message:
-            tokens += self.count_tokens(str(message["role"]))
-        if "name" in message:
-            tokens += self.count_tokens(str(message["name"]))
+        role, name, content = key
+        tokens += self.count_tokens(content)
+        if role is not None:
+            tokens += self.count_tokens(str(role))
+        if name is not None:
+            tokens += self.count_tokens(str(name))
+        
+        if len(self._message_token_cache) >= 4096:
+            self._message_token_cache.clear()
+        self._message_token_cache[key] = tokens
             
         return tokens
     
+    def invalidate(self, message: Dict[str, Any]) -> None:
+        """Forget the cached token count of a message that is about to be edited in place."""
+        self._message_token_cache.pop(self._message_key(message), None)
+    
+    def _system_tokens(self, system_message: str) -> int:
+        """Token count of the system message, which rarely changes between turns."""
+        if not system_message:
+            return 0
+        cached = self._system_tokens_cache
+        if cached is None or cached[0] != system_message:
+            cached = self._system_tokens_cache = (system_message, self.count_tokens(system_message))
+        return cached[1]
+    
+    def _count_many(self, texts: List[str]) -> List[int]:
+        """Token lengths of many strings from one multi-threaded batch encode."""
+        if not texts:
+            return []
+        encoded = self.encoding.encode_batch(texts, num_threads=min(8, os.cpu_count() or 1))
+        return [len(ids) for ids in encoded]
+    
+    def _message_token_counts(self, messages: List[Dict[str, Any]]) -> List[int]:
+        """Per-message token counts, batch-encoding only messages not counted before."""
+        counts = []
+        pending = []  # (index in counts, key, number of texts)
+        texts = []
+        
+        for message in messages:
+            key = self._message_key(message)
+            tokens = self._message_token_cache.get(key)
+            if tokens is None:
+                role, name, content = key
+                fields = [content]
+                if role is not None:
+                    fields.append(str(role))
+                if name is not None:
+                    fields.append(str(name))
+                pending.append((len(counts), key, len(fields)))
+                texts.extend(fields)
+                tokens = 4  # Base tokens for message structure
+            counts.append(tokens)
+        
+        if pending:
+            lengths = iter(self._count_many(texts))
+            if len(self._message_token_cache) + len(pending) > 4096:
+                self._message_token_cache.clear()
+            for index, key, field_count in pending:
+                counts[index] += sum(next(lengths) for _ in range(field_count))
+                self._message_token_cache[key] = counts[index]
+        
+        return counts
+    
+    def count_messages_tokens(self, messages: List[Dict[str, Any]]) -> int:
+        """Count tokens across many message objects with a single batched encode."""
+        if not messages:
+            return 0
+        
+        return sum(self._message_token_counts(messages))
+    
+    def collapse_repeated_messages(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Replace the content of messages already seen in this session with a short placeholder.
+        
+        Only the last history_window messages count as seen, matching a history bounded to
+        the same window, so a placeholder never refers to a message that was evicted.
+        Repeated messages are copied rather than mutated so callers' originals stay intact.
+        """
+        placeholder = "[repeat of prior message]"
+        collapsed = []
+        seen_hashes, seen_order = self._seen_hashes, self._seen_order
+        
+        for message in messages:
+            content = str(_message_field(message, "content", ""))
+            original = None
+            # Collapsing only pays off when the placeholder is shorter than the content
+            if len(content) > len(placeholder):
+                digest = hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+                if digest in seen_hashes:
+                    message = _with_content(message, placeholder)
+                else:
+                    seen_hashes.add(digest)
+                    original = digest
+            collapsed.append(message)
+            
+            seen_order.append(original)
+            if self.history_window is not None and len(seen_order) > self.history_window:
+                evicted = seen_order.popleft()
+                if evicted is not None:
+                    seen_hashes.discard(evicted)
+        
+        return collapsed
+    
+    @staticmethod
+    def _message_key(message: Dict[str, Any]) -> Tuple[Any, Any, str]:
+        """Key identifying the message fields that contribute to its token count."""
+        return _message_reader(type(message))(message)
+    
     def optimize_conversation_context(self, messages: List[Dict[str, Any]], 
-                                    system_message: str = "") -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+                                    system_message: str = "",
+                                    prev_result: Optional[Dict[str, Any]] = None) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
         """
         Optimize conversation context to fit within token limits.
         Returns (optimized_messages, optimization_stats)
+        
+        Passing the stats from a previous call as prev_result reuses its per-message
+        token counts, so only messages added since then are tokenized.
         """
         # Count system message tokens
-        system_tokens = self.count_tokens(system_message) if system_message else 0
+        system_tokens = self._system_tokens(system_message)
         available_tokens = self.max_context_tokens - system_tokens - 500  # Reserve for response
         
         if not messages:
             return [], {"removed_messages": 0, "tokens_saved": 0, "compression_ratio": 1.0}
         
-        # Start with the most recent messages and work backwards
+        # Count each message once, reusing counts from the previous optimization pass
+        # and batch-encoding everything else in a single tiktoken call
+        cached_counts = prev_result.get("token_counts", {}) if prev_result else {}
+        keys = [self._message_key(message) for message in messages]
+        message_tokens = [cached_counts.get(key) for key in keys]
+        missing = [index for index, tokens in enumerate(message_tokens) if tokens is None]
+        if missing:
+            fresh_counts = self._message_token_counts([messages[index] for index in missing])
+            for index, tokens in zip(missing, fresh_counts):
+                message_tokens[index] = tokens
+        token_counts = dict(zip(keys, message_tokens))
+        original_tokens = sum(message_tokens)
+        
+        # Common case: the whole conversation already fits, so there is nothing to drop
+        if original_tokens <= available_tokens:
+            return messages, {
+                "removed_messages": 0,
+                "tokens_saved": 0,
+                "compression_ratio": 1.0,
+                "final_token_count": original_tokens,
+                "original_token_count": original_tokens,
+                "token_counts": token_counts
+            }
+        
+        # Start with the most recent messages and work backwards, collecting newest first
         optimized_messages = []
         current_tokens = 0
-        original_tokens = sum(self.count_message_tokens(msg) for msg in messages)
         
         # Always keep the last few messages for immediate context
-        recent_messages = messages[-3:] if len(messages) > 3 else messages
+        counted_messages = list(zip(messages, message_tokens))
+        recent_messages = counted_messages[-3:] if len(messages) > 3 else counted_messages
         
-        for message in reversed(recent_messages):
-            msg_tokens = self.count_message_tokens(message)
+        for message, msg_tokens in reversed(recent_messages):
             if current_tokens + msg_tokens <= available_tokens:
-                optimized_messages.insert(0, message)
+                optimized_messages.append(message)
                 current_tokens += msg_tokens
             else:
                 break
         
         # If we have room, add more messages from earlier in the conversation
         if len(optimized_messages) < len(messages) and current_tokens < available_tokens * 0.8:
-            older_messages = messages[:-3] if len(messages) > 3 else []
+            older_messages = counted_messages[:-3] if len(messages) > 3 else []
             
-            for message in reversed(older_messages):
-                msg_tokens = self.count_message_tokens(message)
+            for message, msg_tokens in reversed(older_messages):
                 if current_tokens + msg_tokens <= available_tokens:
-                    optimized_messages.insert(0, message)
+                    optimized_messages.append(message)
                     current_tokens += msg_tokens
                 else:
                     break
         
+        optimized_messages.reverse()  # Restore conversation order
+        
         # Calculate optimization stats
         removed_count = len(messages) - len(optimized_messages)
         tokens_saved = original_tokens - current_tokens
@@ -88,7 +366,8 @@ class TokenOptimizer:
             "tokens_saved": tokens_saved,
             "compression_ratio": compression_ratio,
             "final_token_count": current_tokens,
-            "original_token_count": original_tokens
+            "original_token_count": original_tokens,
+            "token_counts": token_counts
         }
         
         return optimized_messages, optimization_stats
@@ -98,29 +377,27 @@ class TokenOptimizer:
         if not messages:
             return ""
         
-        # Extract key information from messages
-        agents_mentioned = set()
-        key_actions = []
-        decisions_made = []
-        files_created = []
+        # Only the counts reach the summary, so tally instead of collecting snippets
+        agents_mentioned = {}  # Ordered set of senders, so the summary text is stable
+        key_actions = 0
+        decisions_made = 0
+        files_created = 0
         
         for message in messages:
-            content = str(message.get("content", ""))
-            sender = message.get("sender", "Unknown")
-            agents_mentioned.add(sender)
+            content = str(_message_field(message, "content", ""))
+            agents_mentioned[_message_field(message, "sender", "Unknown")] = None
             
             # Look for file operations
-            if "write_file" in content or "created file" in content.lower():
-                # Extract file names if possible
-                files_created.append(f"{sender} created/modified files")
+            if _FILE_RE.search(content):
+                files_created += 1
             
             # Look for decisions or implementations
-            if any(keyword in content.lower() for keyword in ["implemented", "decided", "chosen", "completed"]):
-                decisions_made.append(f"{sender}: {content[:100]}...")
+            if _ACTION_RE.search(content):
+                decisions_made += 1
             
             # Look for specific actions
-            if any(keyword in content.lower() for keyword in ["task", "feature", "bug", "issue"]):
-                key_actions.append(f"{sender}: {content[:80]}...")
+            if _TASK_RE.search(content):
+                key_actions += 1
         
         # Create summary
         summary_parts = []
@@ -129,23 +406,26 @@ class TokenOptimizer:
             summary_parts.append(f"Participants: {', '.join(agents_mentioned)}")
         
         if files_created:
-            summary_parts.append(f"File operations: {len(files_created)} files created/modified")
+            summary_parts.append(f"File operations: {files_created} files created/modified")
         
         if key_actions:
-            summary_parts.append(f"Key actions: {len(key_actions)} actions taken")
+            summary_parts.append(f"Key actions: {key_actions} actions taken")
         
         if decisions_made:
-            summary_parts.append(f"Decisions: {len(decisions_made)} decisions made")
+            summary_parts.append(f"Decisions: {decisions_made} decisions made")
         
         return " | ".join(summary_parts) if summary_parts else "No significant activity"
     
     def track_api_call(self, input_tokens: int, output_tokens: int, cost_estimate: float = None):
         """Track an API call for monitoring purposes."""
         self.total_tokens_used += input_tokens + output_tokens
+        self.total_input_tokens += input_tokens
+        self.total_output_tokens += output_tokens
         self.api_calls_made += 1
+        self._summary_dirty = True
         
         call_data = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp_ns": time.time_ns(),  # Format with iso_timestamp() when serializing
             "input_tokens": input_tokens,
             "output_tokens": output_tokens,
             "total_tokens": input_tokens + output_tokens,
@@ -154,57 +434,50 @@ class TokenOptimizer:
             "call_number": self.api_calls_made
         }
         
+        for listener in self._usage_listeners:
+            listener()
+        
         return call_data
     
+    @staticmethod
+    def iso_timestamp(call_data: Dict[str, Any]) -> str:
+        """ISO-format wall-clock time of a call record returned by track_api_call."""
+        return datetime.fromtimestamp(call_data["timestamp_ns"] / 1e9).isoformat()
+    
     def get_usage_summary(self) -> Dict[str, Any]:
         """Get a summary of token usage and costs."""
-        # Updated pricing for different models (as of late 2024)
-        pricing = {
-            "gpt-4": {"input": 0.03, "output": 0.06},
-            "gpt-4-turbo": {"input": 0.01, "output": 0.03},
-            "gpt-4o": {"input": 0.005, "output": 0.015},
-            "gpt-4o-mini": {"input": 0.00015, "output": 0.0006},  # Very cheap!
-            "gpt-3.5-turbo": {"input": 0.0015, "output": 0.002}
-        }
-        
-        # Determine model pricing
-        model_key = self.model.lower()
-        if "gpt-4o-mini" in model_key:
-            rates = pricing["gpt-4o-mini"]
-        elif "gpt-4o" in model_key:
-            rates = pricing["gpt-4o"]
-        elif "gpt-4-turbo" in model_key:
-            rates = pricing["gpt-4-turbo"]
-        elif "gpt-4" in model_key:
-            rates = pricing["gpt-4"]
-        elif "gpt-3.5" in model_key:
-            rates = pricing["gpt-3.5-turbo"]
-        else:
-            # Default to GPT-4 pricing for unknown models
-            rates = pricing["gpt-4"]
-        
-        # Estimate cost (simplified - assumes 70% input, 30% output)
-        input_tokens = int(self.total_tokens_used * 0.7)
-        output_tokens = int(self.total_tokens_used * 0.3)
+        # Usage only changes in track_api_call, so reuse the last summary until then
+        if not self._summary_dirty and self._cached_summary is not None:
+            return self._cached_summary
         
+        rates = self.rates
         estimated_cost = (
-            (input_tokens * rates["input"] / 1000) + 
-            (output_tokens * rates["output"] / 1000)
+            (self.total_input_tokens * rates["input"] / 1000) + 
+            (self.total_output_tokens * rates["output"] / 1000)
         )
         
-        return {
+        self._cached_summary = {
             "total_tokens_used": self.total_tokens_used,
             "api_calls_made": self.api_calls_made,
+            "input_tokens": self.total_input_tokens,
+            "output_tokens": self.total_output_tokens,
             "estimated_cost_usd": round(estimated_cost, 6),  # More precision for cheap models
             "average_tokens_per_call": self.total_tokens_used // max(self.api_calls_made, 1),
             "model": self.model,
             "input_cost_per_1k": rates["input"],
             "output_cost_per_1k": rates["output"]
         }
+        self._summary_dirty = False
+        
+        return self._cached_summary
     
     def should_compress_context(self, messages: List[Dict[str, Any]], system_message: str = "") -> bool:
-        """Determine if context compression is needed."""
-        total_tokens = self.count_tokens(system_message)
-        total_tokens += sum(self.count_message_tokens(msg) for msg in messages)
+        """Determine if context compression is needed.
+        
+        Only messages appended since the last check are tokenized; earlier ones
+        come from the per-message cache.
+        """
+        total_tokens = self._system_tokens(system_message)
+        total_tokens += self.count_messages_tokens(messages)
         
         return total_tokens > self.max_context_tokens * 0.8  # Compress if using >80% of limit 
\ No newline at end of file
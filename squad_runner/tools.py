@@ -6,89 +6,96 @@ from typing import Any, Dict, List, Optional, Callable
 from pathlib import Path
 import json
 
+# Largest file body returned to an agent verbatim; longer files keep their head and tail
+MAX_READ_CHARS = 200_000
+
+# OpenAI function definitions for the workspace tools; shared by every agent, so treat as read-only
+_FUNCTION_DEFS: List[Dict[str, Any]] = [
+    {
+        "type": "function",
+        "function": {
+            "name": "write_file",
+            "description": "Create or update a file in the project workspace",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "file_path": {
+                        "type": "string",
+                        "description": "Path to the file relative to workspace root (e.g., 'main.py', 'src/utils.py')"
+                    },
+                    "content": {
+                        "type": "string", 
+                        "description": "Complete file content to write"
+                    },
+                    "description": {
+                        "type": "string",
+                        "description": "Optional description of what this file does"
+                    }
+                },
+                "required": ["file_path", "content"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "read_file",
+            "description": "Read the contents of a file from the workspace",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "file_path": {
+                        "type": "string",
+                        "description": "Path to the file relative to workspace root"
+                    }
+                },
+                "required": ["file_path"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "list_files",
+            "description": "List all files currently in the workspace",
+            "parameters": {
+                "type": "object",
+                "properties": {},
+                "required": []
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "create_directory",
+            "description": "Create a directory in the workspace",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "dir_path": {
+                        "type": "string",
+                        "description": "Path to the directory relative to workspace root"
+                    }
+                },
+                "required": ["dir_path"]
+            }
+        }
+    }
+]
+
 
 class WorkspaceTools:
     """Function calling tools for workspace file operations."""
     
-    def __init__(self, project_manager, progress_callback=None):
+    def __init__(self, project_manager, progress_callback=None, max_read_chars: int = MAX_READ_CHARS):
         self.project_manager = project_manager
         self.progress_callback = progress_callback
+        self.max_read_chars = max_read_chars
         
     def get_function_definitions(self) -> List[Dict[str, Any]]:
         """Get OpenAI function definitions for workspace tools."""
-        return [
-            {
-                "type": "function",
-                "function": {
-                    "name": "write_file",
-                    "description": "Create or update a file in the project workspace",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "file_path": {
-                                "type": "string",
-                                "description": "Path to the file relative to workspace root (e.g., 'main.py', 'src/utils.py')"
-                            },
-                            "content": {
-                                "type": "string", 
-                                "description": "Complete file content to write"
-                            },
-                            "description": {
-                                "type": "string",
-                                "description": "Optional description of what this file does"
-                            }
-                        },
-                        "required": ["file_path", "content"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "read_file",
-                    "description": "Read the contents of a file from the workspace",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "file_path": {
-                                "type": "string",
-                                "description": "Path to the file relative to workspace root"
-                            }
-                        },
-                        "required": ["file_path"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "list_files",
-                    "description": "List all files currently in the workspace",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "create_directory",
-                    "description": "Create a directory in the workspace",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "dir_path": {
-                                "type": "string",
-                                "description": "Path to the directory relative to workspace root"
-                            }
-                        },
-                        "required": ["dir_path"]
-                    }
-                }
-            }
-        ]
+        return _FUNCTION_DEFS
     
     def get_function_map(self) -> Dict[str, Callable]:
         """Get mapping of function names to actual implementation functions."""
@@ -137,7 +144,19 @@ class WorkspaceTools:
         """Implementation for read_file function."""
         try:
             content = self.project_manager.workspace.read_file(file_path)
-            return f"📄 Contents of {file_path}:\n\n{content}"
+            header = f"📄 Contents of {file_path}:\n\n"
+            
+            # Keep giant files from flooding the context window
+            half = max(self.max_read_chars // 2, 1)
+            if len(content) > 2 * half:
+                omitted = len(content) - 2 * half
+                return "".join((
+                    header, content[:half],
+                    f"\n\n... [truncated {omitted} chars] ...\n\n",
+                    content[-half:]
+                ))
+            
+            return "".join((header, content))
         except FileNotFoundError:
             return f"❌ File not found: {file_path}"
         except Exception as e:
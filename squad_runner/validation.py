@@ -2,7 +2,11 @@
 Input validation utilities for AutoSquad CLI.
 """
 
+import hashlib
+import json
+import mmap
 import os
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -17,13 +21,66 @@ from .exceptions import (
 
 console = Console()
 
+# Keys that passed the live API probe recently, so repeat runs skip the network round-trip
+_API_CHECK_CACHE = Path.home() / ".cache" / "autosquad" / "apikey_ok.json"
+_API_CHECK_TTL = timedelta(hours=6)
 
-def validate_api_key(api_key: Optional[str] = None) -> str:
+# prompt.txt files at least this large are memory-mapped rather than read
+_PROMPT_MMAP_THRESHOLD = 64 * 1024
+_ASCII_WHITESPACE = b" \t\n\r\x0b\x0c"
+
+
+def _api_key_hash(api_key: str) -> str:
+    """Short digest identifying an API key without storing the key itself."""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:32]
+
+
+def _load_api_check_cache() -> dict:
+    """Read the validated-key cache, treating a missing or corrupt file as empty."""
+    try:
+        return json.loads(_API_CHECK_CACHE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _api_key_recently_validated(api_key: str) -> bool:
+    """Whether this key passed the live probe within the cache TTL."""
+    validated_at = _load_api_check_cache().get(_api_key_hash(api_key))
+    if not validated_at:
+        return False
+    try:
+        return datetime.now() - datetime.fromisoformat(validated_at) < _API_CHECK_TTL
+    except ValueError:
+        return False
+
+
+def _record_api_key_validated(api_key: str) -> None:
+    """Remember a successful live probe; failing to write the cache is not an error."""
+    cache = _load_api_check_cache()
+    cache[_api_key_hash(api_key)] = datetime.now().isoformat()
+    try:
+        _API_CHECK_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        _API_CHECK_CACHE.write_text(json.dumps(cache), encoding="utf-8")
+    except OSError:
+        pass
+
+
+def validate_api_key(
+    api_key: Optional[str] = None,
+    skip_check: bool = False,
+    force_check: bool = False
+) -> str:
     """
     Validate OpenAI API key exists and is accessible.
     
+    The live connectivity probe is skipped when skip_check is set (or
+    AUTOSQUAD_SKIP_API_CHECK=1), and when the same key passed it within the
+    last few hours unless force_check is set.
+    
     Args:
         api_key: Optional API key to validate. If None, checks environment.
+        skip_check: Only check the key's presence and format
+        force_check: Always run the live probe, ignoring cached results
         
     Returns:
         Valid API key string
@@ -41,18 +98,26 @@ def validate_api_key(api_key: Optional[str] = None) -> str:
             "Get your API key from: https://platform.openai.com/api-keys"
         )
     
-    if not api_key.startswith(("sk-", "sk-proj-")):
+    # "sk-proj-" keys also start with "sk-", so one prefix covers both formats
+    if not api_key.startswith("sk-"):
         raise APIError(
             "🚫 Invalid OpenAI API key format!\n"
             "API keys should start with 'sk-' or 'sk-proj-'.\n"
             "Please check your API key and try again."
         )
     
+    if skip_check or os.getenv("AUTOSQUAD_SKIP_API_CHECK") == "1":
+        return api_key
+    
+    if not force_check and _api_key_recently_validated(api_key):
+        return api_key
+    
     # Test API connectivity
     try:
         client = openai.OpenAI(api_key=api_key)
         # Simple test call to verify API access
         client.models.list()
+        _record_api_key_validated(api_key)
         return api_key
     except openai.AuthenticationError:
         raise APIError(
@@ -73,6 +138,34 @@ def validate_api_key(api_key: Optional[str] = None) -> str:
         )
 
 
+def _read_prompt(prompt_file: Path) -> str:
+    """Read prompt.txt stripped of surrounding whitespace.
+    
+    Empty files are detected from their size without decoding anything, and large
+    files are memory-mapped so only the span between the whitespace is copied out.
+    """
+    with prompt_file.open("rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return ""
+        if size < _PROMPT_MMAP_THRESHOLD:
+            data = f.read()
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                start, end = 0, size
+                while start < end and mm[start] in _ASCII_WHITESPACE:
+                    start += 1
+                while end > start and mm[end - 1] in _ASCII_WHITESPACE:
+                    end -= 1
+                data = mm[start:end]
+    
+    content = data.decode("utf-8")
+    # Match the newline translation of text-mode reads
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content.strip()
+
+
 def validate_project(project_path: Path) -> Tuple[Path, str]:
     """
     Validate project directory and prompt file.
@@ -108,7 +201,7 @@ def validate_project(project_path: Path) -> Tuple[Path, str]:
         )
     
     try:
-        prompt_content = prompt_file.read_text(encoding='utf-8').strip()
+        prompt_content = _read_prompt(prompt_file)
     except Exception as e:
         raise ProjectError(
             f"🚫 Could not read prompt.txt: {e}\n"
@@ -252,7 +345,9 @@ def validate_all_inputs(
     project_path: Path,
     squad_profile: str,
     model: str,
-    api_key: Optional[str] = None
+    api_key: Optional[str] = None,
+    skip_api_check: bool = False,
+    force_api_check: bool = False
 ) -> Tuple[Path, str, str]:
     """
     Validate all inputs before starting AutoSquad.
@@ -262,6 +357,8 @@ def validate_all_inputs(
         squad_profile: Name of squad profile
         model: Model name
         api_key: Optional API key override
+        skip_api_check: Skip the live API connectivity probe
+        force_api_check: Run the live probe even if the key was validated recently
         
     Returns:
         Tuple of (validated_project_path, prompt_content, validated_api_key)
@@ -274,9 +371,6 @@ def validate_all_inputs(
     # Validate configuration first
     validate_configuration()
     
-    # Validate API key
-    validated_api_key = validate_api_key(api_key)
-    
     # Validate project
     validated_project_path, prompt_content = validate_project(project_path)
     
@@ -286,6 +380,9 @@ def validate_all_inputs(
     # Validate model (with warning for unknown models)
     validate_model(model)
     
+    # Validate API key last, so its network probe only runs once the local checks pass
+    validated_api_key = validate_api_key(api_key, skip_api_check, force_api_check)
+    
     console.print("[dim]✅ All inputs validated successfully[/dim]")
     
     return validated_project_path, prompt_content, validated_api_key 
\ No newline at end of file
@@ -3,38 +3,36 @@
 Simple test script to verify AutoSquad installation
 """
 
+import importlib
 import sys
 from pathlib import Path
 
+# (module, attributes it must provide, label) checked by test_imports, in import order
+IMPORT_MANIFEST = [
+    ("squad_runner", (), "squad_runner"),
+    ("squad_runner.cli", ("main",), "CLI module"),
+    ("squad_runner.config", ("load_config", "load_squad_profile"), "Config module"),
+    ("squad_runner.project_manager", ("ProjectManager",), "ProjectManager"),
+    ("squad_runner.orchestrator", ("SquadOrchestrator",), "SquadOrchestrator"),
+    ("squad_runner.agents", ("create_agent",), "Agents module"),
+]
+
 
 def test_imports():
     """Test that all main modules can be imported."""
     print("Testing imports...")
     
-    try:
-        import squad_runner
-        print("✅ squad_runner imported successfully")
-        
-        from squad_runner.cli import main
-        print("✅ CLI module imported successfully")
-        
-        from squad_runner.config import load_config, load_squad_profile
-        print("✅ Config module imported successfully")
-        
-        from squad_runner.project_manager import ProjectManager
-        print("✅ ProjectManager imported successfully")
-        
-        from squad_runner.orchestrator import SquadOrchestrator
-        print("✅ SquadOrchestrator imported successfully")
-        
-        from squad_runner.agents import create_agent
-        print("✅ Agents module imported successfully")
-        
-        return True
-        
-    except ImportError as e:
-        print(f"❌ Import failed: {e}")
-        return False
+    for module_name, attr_names, label in IMPORT_MANIFEST:
+        try:
+            module = importlib.import_module(module_name)
+            for attr_name in attr_names:
+                getattr(module, attr_name)
+        except (ImportError, AttributeError) as e:
+            print(f"❌ Import failed ({module_name}): {e}")
+            return False
+        print(f"✅ {label} imported successfully")
+    
+    return True
 
 
 def test_config():